@@ -23,6 +23,8 @@ class Settings(BaseSettings):
     volume_multiplier: float = Field(default=1.3, env='VOLUME_MULTIPLIER')
     min_atr: float = Field(default=1.5, env='MIN_ATR')
     max_stock_spread_pct: float = Field(default=0.2, env='MAX_STOCK_SPREAD_PCT')
+    universe_path: Optional[str] = Field(default=None, env='UNIVERSE_PATH')  # .npy scan universe
+    scan_max_concurrency: int = Field(default=32, env='SCAN_MAX_CONCURRENCY')
     
     # Options Filters
     min_dte: int = Field(default=0, env='MIN_DTE')
@@ -18,9 +18,9 @@ from config import load_settings
 from src.utils.logger import setup_logger, get_logger
 from src.data import get_client, get_cache
 from src.scanner import MarketScanner, OptionsFilter, get_default_symbols
-from src.strategies import StrategySelector
+from src.strategies import StrategySelector, Trade
 from src.analytics import ProbabilityCalculator, RiskMetrics
-from src.scoring import TradeScorer
+from src.scoring import ScoredTrade, TradeScorer
 from src.integration import TOSAlertGenerator, WatchlistGenerator
 
 
@@ -63,10 +63,11 @@ class TradingSystem:
         
         # Use default symbols if none provided
         if symbols is None:
-            symbols = get_default_symbols()
+            symbols = get_default_symbols(path=self.settings.universe_path)
             console.print(f"[dim]Scanning {len(symbols)} default symbols[/dim]\n")
         
-        all_trades = []
+        all_trades: List[ScoredTrade] = []
+        all_options_data = []
         
         with Progress(
             SpinnerColumn(),
@@ -117,17 +118,21 @@ class TradingSystem:
                     )
                     risk_metrics['expected_value'] = ev
                 
-                # Score trade
-                score = self.scorer.score_trade(trade, prob_metrics, risk_metrics, options_data)
-                
-                # Add to trade
-                trade['score'] = score
-                trade['probability_metrics'] = prob_metrics
-                trade['risk_metrics'] = risk_metrics
-                
-                all_trades.append(trade)
+                # Keep the Trade; metrics and score travel alongside it
+                all_trades.append(ScoredTrade(trade, prob_metrics, risk_metrics))
+                all_options_data.append(options_data)
                 progress.advance(task2)
             
+            # Score all trades in one batch
+            scores = self.scorer.score_trades(
+                [t.trade for t in all_trades],
+                [t.probability_metrics for t in all_trades],
+                [t.risk_metrics for t in all_trades],
+                all_options_data
+            )
+            for scored, score in zip(all_trades, scores):
+                scored.score = score
+            
             progress.update(task2, completed=True)
         
         console.print(f"✓ Analyzed {len(all_trades)} potential trades\n")
@@ -152,19 +157,19 @@ class TradingSystem:
         
         console.print("\n[bold green]✓ Scan complete![/bold green]")
     
-    def _calculate_probabilities(self, trade: Dict[str, Any]) -> Dict[str, Any]:
+    def _calculate_probabilities(self, trade: Trade) -> Dict[str, Any]:
         """Calculate probability metrics for a trade."""
-        underlying_price = trade.get('underlying_price', 0)
-        legs = trade.get('legs', [])
-        dte = trade.get('dte', 0)
+        underlying_price = trade.underlying_price
+        legs = trade.legs
+        dte = trade.dte or 0
         
         if not legs or dte <= 0:
             return {}
         
         # Get first leg for calculations
         leg = legs[0]
-        strike = leg.get('strike', 0)
-        option_type = leg.get('option_type', 'CALL')
+        strike = leg.strike
+        option_type = leg.option_type
         
         # Estimate IV from leg (simplified)
         # In production, extract from actual option data
@@ -185,7 +190,7 @@ class TradingSystem:
         
         return prob_metrics
     
-    def _display_trades(self, trades: List[Dict[str, Any]]):
+    def _display_trades(self, trades: List[ScoredTrade]):
         """Display trades in a formatted table."""
         table = Table(title="🎯 Top Trade Opportunities", title_style="bold cyan")
         
@@ -199,21 +204,21 @@ class TradingSystem:
         table.add_column("R/R", justify="right", style="cyan")
         table.add_column("Score", justify="right", style="bold green")
         
-        for trade in trades:
-            symbol = trade.get('symbol', '')
-            strategy = trade.get('strategy', '')
-            bias = trade.get('bias', '').capitalize()
-            dte = trade.get('dte', 0)
-            score = trade.get('score', 0)
+        for scored in trades:
+            trade = scored.trade
+            symbol = trade.symbol
+            strategy = trade.strategy
+            bias = trade.bias.capitalize()
+            dte = trade.dte
+            score = scored.score
             
-            risk_metrics = trade.get('risk_metrics', {})
+            risk_metrics = scored.risk_metrics
             max_loss = risk_metrics.get('max_loss', 0)
             max_gain = risk_metrics.get('max_gain', 0)
             rr_ratio = risk_metrics.get('risk_reward_ratio', 0)
             
             # Get strikes
-            legs = trade.get('legs', [])
-            strikes = ' / '.join([f"{leg.get('strike', 0):.0f}" for leg in legs])
+            strikes = ' / '.join([f"{leg.strike:.0f}" for leg in trade.legs])
             
             table.add_row(
                 symbol,
@@ -231,15 +236,18 @@ class TradingSystem:
         
         # Print detailed explanations
         console.print("\n[bold]Trade Explanations:[/bold]\n")
-        for i, trade in enumerate(trades, 1):
-            symbol = trade.get('symbol')
-            explanation = trade.get('explanation', 'No explanation available')
+        for i, scored in enumerate(trades, 1):
+            symbol = scored.trade.symbol
+            explanation = scored.trade.explanation
             console.print(f"[cyan]{i}. {symbol}:[/cyan] {explanation}")
     
-    def _generate_outputs(self, trades: List[Dict[str, Any]]):
+    def _generate_outputs(self, scored_trades: List[ScoredTrade]):
         """Generate output files for trades."""
         console.print("\n[bold]Generating outputs...[/bold]")
         
+        # Outputs and the cache take plain dictionaries
+        trades = [t.to_dict() for t in scored_trades]
+        
         # Save trades to JSON
         output_dir = Path(self.settings.output_dir) / "trades"
         output_dir.mkdir(parents=True, exist_ok=True)
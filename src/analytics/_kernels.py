@@ -0,0 +1,44 @@
+"""Compiled indicator kernels for the market scanner hot loop.
+
+Each kernel reduces NumPy arrays to the last indicator value the scanner
+needs. With Numba installed they are compiled once and cached on disk
+(cache=True), so later processes skip the JIT warmup.
+"""
+
+import numpy as np
+
+from ._njit import njit
+
+
+@njit(cache=True)
+def atr_last(high, low, close, period):
+    """Latest simple-average True Range over the last `period` bars (NaN if too short)."""
+    n = close.shape[0]
+    if n < period + 1:
+        return np.nan
+    total = 0.0
+    for i in range(n - period, n):
+        prev_close = close[i - 1]
+        total += max(high[i] - low[i], abs(high[i] - prev_close), abs(low[i] - prev_close))
+    return total / period
+
+
+@njit(cache=True)
+def rsi_last(close, period):
+    """Latest RSI using simple averages of gains/losses (50.0 if undefined)."""
+    n = close.shape[0]
+    if n < period + 1:
+        return 50.0
+    gain = 0.0
+    loss = 0.0
+    for i in range(n - period, n):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            gain += delta
+        else:
+            loss -= delta
+    if loss == 0.0:
+        return 50.0 if gain == 0.0 else 100.0
+    rs = (gain / period) / (loss / period)
+    return 100.0 - 100.0 / (1.0 + rs)
+
@@ -1,11 +1,19 @@
 """Market data anomaly detection."""
 
-from typing import List, Dict, Any
+import math
+from collections import deque
+from typing import List, Dict, Any, Union
 import numpy as np
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Z-score > 4 is highly unlikely (99.99% confidence)
+Z_SCORE_THRESHOLD = 4.0
+
+# Fewest history points before a z-score is meaningful
+MIN_HISTORY = 5
+
 class AnomalyDetector:
     """Detect anomalies in market data."""
     
@@ -13,35 +21,64 @@ class AnomalyDetector:
         self.price_threshold = price_deviation_threshold
         self.volume_multiplier = volume_multiplier
         
-    def is_price_anomaly(self, current_price: float, history: List[float]) -> bool:
+    def is_price_anomaly(self, current_price: float, history: Union[List[float], np.ndarray]) -> bool:
         """
         Check if current price is a statistical outlier vs history.
         
         Args:
             current_price: Latest price
-            history: List of historical prices (last N periods)
+            history: Historical prices (last N periods); pass a float64
+                ndarray to skip the conversion when checking repeatedly
             
         Returns:
             True if anomaly
         """
-        if not history or len(history) < 5:
+        if history is None or len(history) < MIN_HISTORY:
             return False
-            
-        avg = np.mean(history)
-        std = np.std(history)
+        
+        hist = np.asarray(history, dtype=np.float64)
+        avg = hist.mean()
+        std = hist.std()
         
         if std == 0:
-            return abs(current_price - avg) > (avg * self.price_threshold)
+            return bool(abs(current_price - avg) > (avg * self.price_threshold))
             
         z_score = abs(current_price - avg) / std
         
-        # Z-score > 4 is highly unlikely (99.99% confidence)
-        if z_score > 4.0:
+        if z_score > Z_SCORE_THRESHOLD:
             logger.warning(f"Price anomaly detected: {current_price} (Z-Score: {z_score:.2f})")
             return True
             
         return False
         
+    def price_anomaly_mask(
+        self,
+        current_prices: Any,
+        means: Any,
+        stds: Any
+    ) -> np.ndarray:
+        """
+        Vectorized is_price_anomaly over precomputed history statistics.
+        
+        Args:
+            current_prices: Latest price(s)
+            means: Mean of each price history
+            stds: Standard deviation of each price history
+            
+        Returns:
+            Boolean array, True where the price is an anomaly
+        """
+        current_prices = np.asarray(current_prices, dtype=np.float64)
+        means = np.asarray(means, dtype=np.float64)
+        stds = np.asarray(stds, dtype=np.float64)
+        
+        deviation = np.abs(current_prices - means)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z_scores = deviation / stds
+        
+        # Flat history falls back to a percentage deviation check
+        return np.where(stds == 0, deviation > means * self.price_threshold, z_scores > Z_SCORE_THRESHOLD)
+        
     def detect_bad_tick(self, quote: Dict[str, Any], prev_close: float) -> bool:
         """
         Simple check for massive % moves that indicate bad data.
@@ -66,3 +103,90 @@ class AnomalyDetector:
             return True
             
         return False
+
+
+class RollingAnomalyDetector:
+    """
+    Streaming price anomaly check over a fixed window of recent prices.
+    
+    Keeps a running mean and sum of squared deviations (Welford), updated
+    in O(1) as prices enter and leave the window, so each check avoids
+    recomputing statistics over the whole history. Same rules as
+    AnomalyDetector.is_price_anomaly.
+    """
+    
+    def __init__(self, window: int = 20, price_deviation_threshold: float = 0.05):
+        """
+        Initialize rolling detector.
+        
+        Args:
+            window: Number of recent prices kept
+            price_deviation_threshold: Max fractional deviation when the window is flat
+        """
+        self.window = window
+        self.price_threshold = price_deviation_threshold
+        self._prices: deque = deque()
+        self._mean = 0.0
+        self._m2 = 0.0
+    
+    def __len__(self) -> int:
+        return len(self._prices)
+    
+    @property
+    def mean(self) -> float:
+        """Mean of the prices in the window."""
+        return self._mean
+    
+    @property
+    def std(self) -> float:
+        """Population standard deviation of the prices in the window."""
+        n = len(self._prices)
+        return math.sqrt(self._m2 / n) if n else 0.0
+    
+    def update(self, price: float):
+        """
+        Add a price, dropping the oldest once the window is full.
+        
+        Args:
+            price: Latest price
+        """
+        self._prices.append(price)
+        n = len(self._prices)
+        delta = price - self._mean
+        self._mean += delta / n
+        self._m2 += delta * (price - self._mean)
+        
+        if n > self.window:
+            old = self._prices.popleft()
+            n -= 1
+            delta = old - self._mean
+            self._mean -= delta / n
+            # Removal can drift slightly negative in floating point
+            self._m2 = max(self._m2 - delta * (old - self._mean), 0.0)
+    
+    def is_anomaly(self, current_price: float) -> bool:
+        """
+        Check if a price is a statistical outlier vs the current window.
+        
+        Args:
+            current_price: Latest price (not added; call update afterwards)
+            
+        Returns:
+            True if anomaly
+        """
+        if len(self._prices) < MIN_HISTORY:
+            return False
+        
+        avg = self._mean
+        std = self.std
+        deviation = abs(current_price - avg)
+        
+        if std == 0:
+            return deviation > (avg * self.price_threshold)
+        
+        z_score = deviation / std
+        if z_score > Z_SCORE_THRESHOLD:
+            logger.warning(f"Price anomaly detected: {current_price} (Z-Score: {z_score:.2f})")
+            return True
+        
+        return False
@@ -2,6 +2,7 @@
 
 from typing import Dict, Any, List, Optional
 import numpy as np
+from scipy.stats import norm
 from py_vollib.black_scholes.greeks.analytical import delta, gamma, theta, vega, rho
 from src.utils.logger import get_logger
 
@@ -65,6 +66,62 @@ class GreeksCalculator:
             logger.error(f"Error calculating Greeks: {e}")
             return {'delta': 0, 'gamma': 0, 'theta': 0, 'vega': 0, 'rho': 0}
             
+    @staticmethod
+    def calculate_greeks_batch(
+        S: np.ndarray,
+        K: np.ndarray,
+        T: np.ndarray,
+        r: float,
+        sigma: np.ndarray,
+        option_type: str = 'c'
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate all Greeks for many options with the Black-Scholes closed form.
+        
+        Inputs broadcast against each other (e.g. S[:, None] with sigma[None, :]
+        for a grid). Results use the same units as calculate_all_greeks, and
+        entries with T <= 0 or sigma <= 0 are 0.
+        
+        Args:
+            S: Current stock prices
+            K: Strike prices
+            T: Times to expiration (years)
+            r: Risk-free rate
+            sigma: Implied volatilities
+            option_type: 'c' or 'p' for call/put (default: 'c')
+            
+        Returns:
+            Dictionary of Greek name to array of the broadcast shape
+        """
+        is_put = option_type.lower()[0] == 'p'
+        S, K, T, sigma = np.broadcast_arrays(
+            *(np.asarray(x, dtype=np.float64) for x in (S, K, T, sigma))
+        )
+        valid = (T > 0) & (sigma > 0)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sqrt_t = np.sqrt(T)
+            vol_sqrt_t = sigma * sqrt_t
+            d1 = (np.log(S / K) + (r + 0.5 * sigma * sigma) * T) / vol_sqrt_t
+            d2 = d1 - vol_sqrt_t
+            pdf_d1 = norm.pdf(d1)
+            discounted_k = K * np.exp(-r * T)
+            
+            sign = -1.0 if is_put else 1.0
+            n_d2 = norm.cdf(sign * d2)
+            d = norm.cdf(d1) - 1.0 if is_put else norm.cdf(d1)
+            g = pdf_d1 / (S * vol_sqrt_t)
+            # Mirror py_vollib's per-day theta and per-point vega/rho, then the
+            # same rescaling calculate_all_greeks applies on top
+            t = (-S * pdf_d1 * sigma / (2 * sqrt_t) - sign * r * discounted_k * n_d2) / 365.0 / 365.0
+            v = S * pdf_d1 * sqrt_t * 0.01 / 100.0
+            rh = sign * T * discounted_k * n_d2 * 0.01 / 100.0
+        
+        return {
+            name: np.where(valid, value, 0.0)
+            for name, value in (('delta', d), ('gamma', g), ('theta', t), ('vega', v), ('rho', rh))
+        }
+            
     @staticmethod
     def calculate_portfolio_greeks(trades: List[Any]) -> Dict[str, float]:
         """
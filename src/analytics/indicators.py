@@ -1,12 +1,67 @@
 """Technical analysis indicators."""
 
+import threading
 import pandas as pd
 import numpy as np
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+
+from ._njit import njit
+
+
+@njit(cache=True)
+def _rsi_loop(gains: np.ndarray, losses: np.ndarray, period: int) -> np.ndarray:
+    """
+    RSI from per-bar gains and losses using simple rolling averages.
+    
+    Matches the pandas rolling-mean formulation; undefined values are 50.
+    
+    Args:
+        gains: Upward move per bar (0 for the first bar, flat or NaN moves)
+        losses: Downward move per bar, as positive numbers
+        period: Lookback period
+        
+    Returns:
+        RSI values, one per bar
+    """
+    n = gains.shape[0]
+    out = np.full(n, 50.0)
+    for i in range(period - 1, n):
+        gain_sum = 0.0
+        loss_sum = 0.0
+        for j in range(i - period + 1, i + 1):
+            gain_sum += gains[j]
+            loss_sum += losses[j]
+        if loss_sum > 0:
+            out[i] = 100.0 - 100.0 / (1.0 + gain_sum / loss_sum)
+        elif gain_sum > 0:
+            out[i] = 100.0
+    return out
+
 
 class TechnicalIndicators:
     """Calculate technical indicators for market data."""
     
+    # Per-thread gain/loss buffers reused by calculate_rsi; grown, never shrunk
+    _scratch = threading.local()
+    
+    @staticmethod
+    def _rsi_buffers(n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Scratch gain and loss arrays of length n for the calling thread.
+        
+        Args:
+            n: Number of prices
+            
+        Returns:
+            Tuple of (gains, losses) views; contents are undefined
+        """
+        scratch = TechnicalIndicators._scratch
+        gains = getattr(scratch, 'gains', None)
+        if gains is None or gains.shape[0] < n:
+            scratch.gains = gains = np.empty(n)
+            scratch.losses = np.empty(n)
+        return gains[:n], scratch.losses[:n]
+    
     @staticmethod
     def calculate_rsi(prices: pd.Series, period: int = 14) -> pd.Series:
         """
@@ -19,15 +74,24 @@ class TechnicalIndicators:
         Returns:
             Series of RSI values
         """
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
+        if period < 1:
+            raise ValueError("period must be >= 1")
+        
+        if prices.empty:
+            return pd.Series(index=prices.index, dtype=np.float64, name=prices.name)
+        
+        values = prices.to_numpy(dtype=np.float64)
+        gains, losses = TechnicalIndicators._rsi_buffers(values.shape[0])
+        
+        # Split moves into gains/losses in place; the first bar is a zero move
+        # and fmax maps NaN moves to 0
+        gains[0] = losses[0] = 0.0
+        np.subtract(values[1:], values[:-1], out=gains[1:])
+        np.negative(gains[1:], out=losses[1:])
+        np.fmax(gains[1:], 0.0, out=gains[1:])
+        np.fmax(losses[1:], 0.0, out=losses[1:])
         
-        # Fill NaNs
-        return rsi.fillna(50.0)
+        return pd.Series(_rsi_loop(gains, losses, period), index=prices.index, name=prices.name)
 
     @staticmethod
     def calculate_macd(
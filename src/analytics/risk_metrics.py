@@ -1,9 +1,10 @@
 """Risk metrics calculations for options trades."""
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Sequence
 import math
 
 from src.utils.logger import get_logger
+from src.strategies.strategy_configs import Leg, Trade
 
 
 logger = get_logger(__name__)
@@ -13,17 +14,17 @@ class RiskMetrics:
     """Calculate risk metrics for options trades."""
     
     @staticmethod
-    def calculate_trade_metrics(trade: Dict[str, Any]) -> Dict[str, Any]:
+    def calculate_trade_metrics(trade: Trade) -> Dict[str, Any]:
         """
         Calculate comprehensive risk metrics for a trade.
         
         Args:
-            trade: Trade structure with legs
+            trade: Trade from the strategy selector
             
         Returns:
             Dictionary with risk metrics
         """
-        legs = trade.get('legs', [])
+        legs = trade.legs
         
         if not legs:
             return {}
@@ -31,10 +32,10 @@ class RiskMetrics:
         # Calculate net debit/credit
         net_cost = 0
         for leg in legs:
-            price = leg.get('price', 0)
-            quantity = leg.get('quantity', 1)
+            price = leg.price
+            quantity = leg.quantity
             
-            if leg.get('action') == 'BUY':
+            if leg.action == 'BUY':
                 net_cost += price * quantity * 100  # Options are per 100 shares
             else:  # SELL
                 net_cost -= price * quantity * 100
@@ -43,7 +44,7 @@ class RiskMetrics:
         is_debit = net_cost > 0
         
         # Calculate max loss and max gain based on strategy
-        strategy = trade.get('strategy', '')
+        strategy = trade.strategy
         
         if 'Spread' in strategy:
             metrics = RiskMetrics._calculate_spread_metrics(trade, legs, net_cost, is_debit)
@@ -70,8 +71,8 @@ class RiskMetrics:
     
     @staticmethod
     def _calculate_single_option_metrics(
-        trade: Dict[str, Any],
-        legs: List[Dict[str, Any]],
+        trade: Trade,
+        legs: Sequence[Leg],
         net_cost: float
     ) -> Dict[str, Any]:
         """Calculate metrics for single long option."""
@@ -81,14 +82,14 @@ class RiskMetrics:
         max_loss = abs(net_cost)
         
         # Max gain is theoretically unlimited for calls, strike - premium for puts
-        if leg.get('option_type') == 'CALL':
+        if leg.option_type == 'CALL':
             max_gain = float('inf')  # Unlimited
             # Use 2x current price as practical max for display
-            underlying_price = trade.get('underlying_price', 0)
-            practical_max_gain = (underlying_price * 2 - leg.get('strike', 0)) * 100 - max_loss
+            underlying_price = trade.underlying_price
+            practical_max_gain = (underlying_price * 2 - leg.strike) * 100 - max_loss
             max_gain = max(practical_max_gain, max_loss * 3)  # At least 3:1 for display
         else:  # PUT
-            strike = leg.get('strike', 0)
+            strike = leg.strike
             max_gain = (strike * 100) - max_loss
         
         return {
@@ -98,8 +99,8 @@ class RiskMetrics:
     
     @staticmethod
     def _calculate_spread_metrics(
-        trade: Dict[str, Any],
-        legs: List[Dict[str, Any]],
+        trade: Trade,
+        legs: Sequence[Leg],
         net_cost: float,
         is_debit: bool
     ) -> Dict[str, Any]:
@@ -108,7 +109,7 @@ class RiskMetrics:
             return {'max_loss': 0, 'max_gain': 0}
         
         # Get strikes
-        strikes = [leg.get('strike', 0) for leg in legs]
+        strikes = [leg.strike for leg in legs]
         spread_width = abs(strikes[0] - strikes[1]) * 100  # Convert to dollars
         
         if is_debit:
@@ -128,8 +129,8 @@ class RiskMetrics:
     
     @staticmethod
     def _calculate_iron_condor_metrics(
-        trade: Dict[str, Any],
-        legs: List[Dict[str, Any]]
+        trade: Trade,
+        legs: Sequence[Leg]
     ) -> Dict[str, Any]:
         """Calculate metrics for iron condor."""
         if len(legs) < 4:
@@ -138,15 +139,15 @@ class RiskMetrics:
         # Calculate net credit received
         net_credit = 0
         for leg in legs:
-            price = leg.get('price', 0)
-            if leg.get('action') == 'SELL':
+            price = leg.price
+            if leg.action == 'SELL':
                 net_credit += price * 100
             else:
                 net_credit -= price * 100
         
         # Get spread widths
-        call_strikes = [leg.get('strike', 0) for leg in legs if leg.get('option_type') == 'CALL']
-        put_strikes = [leg.get('strike', 0) for leg in legs if leg.get('option_type') == 'PUT']
+        call_strikes = [leg.strike for leg in legs if leg.option_type == 'CALL']
+        put_strikes = [leg.strike for leg in legs if leg.option_type == 'PUT']
         
         call_spread_width = abs(call_strikes[0] - call_strikes[1]) * 100 if len(call_strikes) == 2 else 0
         put_spread_width = abs(put_strikes[0] - put_strikes[1]) * 100 if len(put_strikes) == 2 else 0
@@ -163,27 +164,27 @@ class RiskMetrics:
     
     @staticmethod
     def _calculate_breakeven(
-        trade: Dict[str, Any],
-        legs: List[Dict[str, Any]],
+        trade: Trade,
+        legs: Sequence[Leg],
         net_cost: float
     ) -> List[float]:
         """Calculate break-even points."""
-        strategy = trade.get('strategy', '')
+        strategy = trade.strategy
         
         if len(legs) == 1:
             # Single option
             leg = legs[0]
-            strike = leg.get('strike', 0)
+            strike = leg.strike
             premium = abs(net_cost) / 100
             
-            if leg.get('option_type') == 'CALL':
+            if leg.option_type == 'CALL':
                 return [strike + premium]
             else:
                 return [strike - premium]
         
         elif 'Spread' in strategy:
             # Vertical spread
-            strikes = sorted([leg.get('strike', 0) for leg in legs])
+            strikes = sorted([leg.strike for leg in legs])
             premium = abs(net_cost) / 100
             
             if 'Call' in strategy:
@@ -199,8 +200,8 @@ class RiskMetrics:
         
         elif 'Iron Condor' in strategy:
             # Two break-even points
-            call_strikes = sorted([leg.get('strike', 0) for leg in legs if leg.get('option_type') == 'CALL'])
-            put_strikes = sorted([leg.get('strike', 0) for leg in legs if leg.get('option_type') == 'PUT'])
+            call_strikes = sorted([leg.strike for leg in legs if leg.option_type == 'CALL'])
+            put_strikes = sorted([leg.strike for leg in legs if leg.option_type == 'PUT'])
             
             net_credit = abs(net_cost) / 100
             
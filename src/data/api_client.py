@@ -1,5 +1,6 @@
 """TD Ameritrade API client wrapper with rate limiting and caching."""
 
+import threading
 import time
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
@@ -74,6 +75,7 @@ class TDAClient:
         self.client: Optional[tda.client.Client] = None
         self._last_request_time = 0
         self._min_request_interval = 0.5  # 500ms between requests
+        self._rate_lock = threading.Lock()
         self.circuit_breaker = CircuitBreaker()
         self._initialize_client()
     
@@ -98,15 +100,17 @@ class TDAClient:
             self.client = None
     
     def _rate_limit(self):
-        """Enforce rate limiting between API requests."""
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
+        """Enforce rate limiting between API requests (thread-safe)."""
+        # Reserve the next request slot under the lock, then sleep outside it
+        # so concurrent scanner workers queue up at the configured interval
+        with self._rate_lock:
+            current_time = time.time()
+            scheduled_time = max(current_time, self._last_request_time + self._min_request_interval)
+            self._last_request_time = scheduled_time
         
-        if time_since_last < self._min_request_interval:
-            sleep_time = self._min_request_interval - time_since_last
+        sleep_time = scheduled_time - current_time
+        if sleep_time > 0:
             time.sleep(sleep_time)
-        
-        self._last_request_time = time.time()
     
     @retry(
         stop=stop_after_attempt(3),
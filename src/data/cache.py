@@ -4,15 +4,39 @@ import json
 import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from contextlib import contextmanager
 
 from src.utils.logger import get_logger
 
+# orjson (de)serializes large option chains several times faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 logger = get_logger(__name__)
 
 
+def _dumps(data: Any):
+    """Serialize data for storage, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data)
+
+
+def _loads(data) -> Any:
+    """Deserialize data written by _dumps (or older json text)."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Rows written by json.dumps may hold NaN literals orjson rejects
+            pass
+    return json.loads(data)
+
+
 class Cache:
     """SQLite-based cache for market data."""
     
@@ -67,6 +91,21 @@ class Cache:
             # Options chain cache table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS option_chains (
+                    symbol TEXT PRIMARY KEY,
+                    data TEXT NOT NULL,
+                    timestamp REAL NOT NULL,
+                    expires_at REAL
+                )
+            """)
+            
+            # Databases created before per-entry TTLs lack expires_at
+            cursor.execute("PRAGMA table_info(option_chains)")
+            if 'expires_at' not in {row['name'] for row in cursor.fetchall()}:
+                cursor.execute("ALTER TABLE option_chains ADD COLUMN expires_at REAL")
+            
+            # Per-symbol indicator stats for scanner pre-filtering
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS scan_stats (
                     symbol TEXT PRIMARY KEY,
                     data TEXT NOT NULL,
                     timestamp REAL NOT NULL
@@ -87,6 +126,7 @@ class Cache:
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_quotes_timestamp ON quotes(timestamp)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_price_history_timestamp ON price_history(timestamp)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_option_chains_timestamp ON option_chains(timestamp)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_scan_stats_timestamp ON scan_stats(timestamp)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_scan_results_date ON scan_results(scan_date)")
             
             logger.info("✓ Cache database initialized")
@@ -181,21 +221,84 @@ class Cache:
                 (symbol, json.dumps(data), datetime.now().timestamp())
             )
     
-    def get_option_chain(self, symbol: str, ttl_seconds: int = 300) -> Optional[Dict[str, Any]]:
+    def get_option_chain(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
         Get cached option chain if available and not expired.
         
         Args:
             symbol: Stock ticker symbol
-            ttl_seconds: Time to live in seconds (default: 300 = 5 minutes)
             
         Returns:
             Cached option chain or None
         """
+        entry = self.get_option_chain_entry(symbol)
+        if entry and entry[1] > datetime.now():
+            return entry[0]
+        
+        return None
+    
+    def get_option_chain_entry(self, symbol: str) -> Optional[Tuple[Dict[str, Any], datetime]]:
+        """
+        Get cached option chain with its expiry, even if already expired.
+        
+        Args:
+            symbol: Stock ticker symbol
+            
+        Returns:
+            Tuple of (option chain, expires_at) or None
+        """
         with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                "SELECT data, timestamp FROM option_chains WHERE symbol = ?",
+                "SELECT data, timestamp, expires_at FROM option_chains WHERE symbol = ?",
+                (symbol,)
+            )
+            row = cursor.fetchone()
+            
+            if not row:
+                return None
+            
+            # Rows written before per-entry TTLs fall back to the old 5 minute TTL
+            expires_at = row['expires_at'] if row['expires_at'] is not None else row['timestamp'] + 300
+            return _loads(row['data']), datetime.fromtimestamp(expires_at)
+    
+    def set_option_chain(
+        self,
+        symbol: str,
+        data: Dict[str, Any],
+        ttl: timedelta = timedelta(minutes=5)
+    ):
+        """
+        Cache option chain data.
+        
+        Args:
+            symbol: Stock ticker symbol
+            data: Option chain data to cache
+            ttl: How long the chain stays fresh (default: 5 minutes)
+        """
+        now = datetime.now()
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "INSERT OR REPLACE INTO option_chains (symbol, data, timestamp, expires_at) VALUES (?, ?, ?, ?)",
+                (symbol, _dumps(data), now.timestamp(), (now + ttl).timestamp())
+            )
+    
+    def get_scan_stats(self, symbol: str, ttl_seconds: int = 21600) -> Optional[Dict[str, Any]]:
+        """
+        Get cached scanner stats (ATR, average volume, RSI) for a symbol.
+        
+        Args:
+            symbol: Stock ticker symbol
+            ttl_seconds: Time to live in seconds (default: 21600 = 6 hours)
+            
+        Returns:
+            Cached stats or None
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT data, timestamp FROM scan_stats WHERE symbol = ?",
                 (symbol,)
             )
             row = cursor.fetchone()
@@ -204,22 +307,22 @@ class Cache:
                 if not self._is_expired(row['timestamp'], ttl_seconds):
                     return json.loads(row['data'])
                 else:
-                    cursor.execute("DELETE FROM option_chains WHERE symbol = ?", (symbol,))
+                    cursor.execute("DELETE FROM scan_stats WHERE symbol = ?", (symbol,))
             
             return None
     
-    def set_option_chain(self, symbol: str, data: Dict[str, Any]):
+    def set_scan_stats(self, symbol: str, data: Dict[str, Any]):
         """
-        Cache option chain data.
+        Cache scanner stats for a symbol.
         
         Args:
             symbol: Stock ticker symbol
-            data: Option chain data to cache
+            data: Stats to cache (atr, avg_volume, rsi, computed_at)
         """
         with self._get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                "INSERT OR REPLACE INTO option_chains (symbol, data, timestamp) VALUES (?, ?, ?)",
+                "INSERT OR REPLACE INTO scan_stats (symbol, data, timestamp) VALUES (?, ?, ?)",
                 (symbol, json.dumps(data), datetime.now().timestamp())
             )
     
@@ -252,8 +355,14 @@ class Cache:
             # Clear expired price history (> 1 hour)
             cursor.execute("DELETE FROM price_history WHERE timestamp < ?", (now - 3600,))
             
-            # Clear expired option chains (> 5 minutes)
-            cursor.execute("DELETE FROM option_chains WHERE timestamp < ?", (now - 300,))
+            # Clear expired option chains (per-entry TTL, 5 minutes for older rows)
+            cursor.execute(
+                "DELETE FROM option_chains WHERE COALESCE(expires_at, timestamp + 300) < ?",
+                (now,)
+            )
+            
+            # Clear expired scan stats (> 6 hours)
+            cursor.execute("DELETE FROM scan_stats WHERE timestamp < ?", (now - 21600,))
             
             logger.info("✓ Cleared expired cache entries")
 
@@ -14,16 +14,20 @@ class TradeRepository:
     def __init__(self, session: Session = None):
         self.session = session or get_session()
         
-    def add_trade(self, trade_data: Dict[str, Any]) -> bool:
+    def add_trade(self, trade_data: Any) -> bool:
         """
         Add a trade to the database.
         
         Args:
-            trade_data: Dictionary containing trade information
+            trade_data: Dictionary containing trade information, or a
+                scored trade with a to_dict() method
             
         Returns:
             True if successful, False otherwise
         """
+        if not isinstance(trade_data, dict):
+            trade_data = trade_data.to_dict()
+        
         try:
             # Extract fields that map directly to columns
             db_trade = TradeModel(
@@ -1,5 +1,7 @@
 """Data validation and freshness checks."""
 
+import math
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any
 from src.utils.logger import get_logger
@@ -11,6 +13,7 @@ class DataValidator:
     
     def __init__(self, max_age_seconds: int = 60):
         self.max_age_seconds = max_age_seconds
+        self.max_age_ms = int(max_age_seconds * 1000)
         
     def check_freshness(self, timestamp: Any) -> bool:
         """
@@ -22,15 +25,24 @@ class DataValidator:
         Returns:
             True if fresh, False if stale
         """
-        now = datetime.now(timezone.utc)
-        
         if isinstance(timestamp, (int, float)):
-            # TDA sends timestamps in ms
+            # TDA sends epoch timestamps in ms; compare in integer ms against
+            # the wall clock (monotonic time has no fixed epoch to compare with)
             try:
-                data_time = datetime.fromtimestamp(timestamp / 1000.0, tz=timezone.utc)
-            except Exception:
+                if not math.isfinite(timestamp):
+                    return False
+            except OverflowError:
+                return False
+            
+            age_ms = time.time_ns() // 1_000_000 - timestamp
+            if age_ms > self.max_age_ms:
+                logger.warning(f"Data stale: {age_ms / 1000:.1f}s old (Limit: {self.max_age_seconds}s)")
                 return False
-        elif isinstance(timestamp, datetime):
+            return True
+        
+        now = datetime.now(timezone.utc)
+        
+        if isinstance(timestamp, datetime):
             data_time = timestamp
             if data_time.tzinfo is None:
                 # Assume UTC if naive, though dangerous
@@ -1,6 +1,6 @@
 """Scanner package initialization."""
 
-from .market_scanner import MarketScanner, get_default_symbols
+from .market_scanner import MarketScanner, get_default_symbols, get_universe
 from .options_filter import OptionsFilter
 
-__all__ = ['MarketScanner', 'get_default_symbols', 'OptionsFilter']
+__all__ = ['MarketScanner', 'get_default_symbols', 'get_universe', 'OptionsFilter']
@@ -1,22 +1,39 @@
 """Market scanner for filtering stock candidates."""
 
-import pandas as pd
+import asyncio
+import threading
+import time
 import numpy as np
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 from config.settings import get_settings
 from src.data import get_client, get_cache
 from src.utils.logger import get_logger
-from src.utils.validators import is_valid_price, calculate_spread_pct
+from src.utils.single_flight import SingleFlight
+from src.utils.validators import calculate_spread_pct_batch
 
 # New Components
 from src.data.validator import DataValidator
-from src.analytics.anomaly import AnomalyDetector
-from src.analytics.indicators import TechnicalIndicators
+from src.analytics.anomaly import AnomalyDetector, MIN_HISTORY
+from src.analytics import _kernels as kernels
 
 logger = get_logger(__name__)
 
+# Max symbols per batched quote request
+QUOTE_BATCH_SIZE = 200
+
+# Initial scratch capacity (candles); buffers grow if a history is longer
+SCRATCH_SIZE = 64
+
+# Cached per-symbol stats (ATR, avg volume, RSI) stay valid for 6 hours
+SCAN_STATS_TTL = 21600
+
+# Symbols whose cached stats fall below this fraction of the ATR/volume
+# thresholds are skipped without fetching history
+SCAN_STATS_SKIP_MARGIN = 0.7
+
 
 class MarketScanner:
     """Scan and filter stocks based on trading criteria."""
@@ -30,6 +47,12 @@ class MarketScanner:
         # Initialize robust components
         self.validator = DataValidator()
         self.anomaly_detector = AnomalyDetector()
+        
+        # Collapse concurrent cache misses into one API call per key
+        self._single_flight = SingleFlight()
+        
+        # Per-worker scratch arrays reused across symbols
+        self._scratch = threading.local()
     
     def scan_market(self, symbols: List[str]) -> List[Dict[str, Any]]:
         """
@@ -41,92 +64,268 @@ class MarketScanner:
         Returns:
             List of candidate dictionaries with analysis
         """
+        return asyncio.run(self.scan_market_async(symbols))
+    
+    async def scan_market_async(self, symbols: List[str]) -> List[Dict[str, Any]]:
+        """
+        Scan symbols concurrently and return filtered candidates.
+        
+        Quotes are fetched in batch and filtered for freshness, price and
+        spread in one vectorized pass. Survivors then run through history and
+        indicator checks in worker threads so API round-trips overlap, bounded
+        by the scan_max_concurrency setting. The client's rate limiter still
+        spaces out the actual requests.
+        
+        Args:
+            symbols: List of symbols to scan
+            
+        Returns:
+            List of candidate dictionaries, in input symbol order
+        """
         logger.info(f"🔍 Scanning {len(symbols)} symbols...")
         
+        quotes = await asyncio.to_thread(self._get_quotes_with_cache, symbols)
+        survivors = self._skip_cold_symbols(self._filter_quotes(symbols, quotes))
+        
+        semaphore = asyncio.Semaphore(self.settings.scan_max_concurrency)
+        
+        async def process(symbol: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await asyncio.to_thread(self._process_symbol, symbol, quotes[symbol])
+        
+        results = await asyncio.gather(
+            *(process(symbol) for symbol in survivors),
+            return_exceptions=True
+        )
+        
         candidates = []
+        for symbol, result in zip(survivors, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error scanning {symbol}: {result}")
+            elif result:
+                candidates.append(result)
         
+        logger.info(f"✓ Found {len(candidates)} candidates")
+        return candidates
+    
+    def _get_quotes_with_cache(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get quotes for many symbols, batching cache misses into one API call.
+        
+        Args:
+            symbols: List of symbols
+            
+        Returns:
+            Dict of symbol -> quote for symbols with data
+        """
+        quotes = {}
+        missing = []
         for symbol in symbols:
-            try:
-                # Get quote data
-                quote = self._get_quote_with_cache(symbol)
-                if not quote:
-                    continue
-                
-                # 1. New: Data Freshness Check
-                if not self.validator.check_freshness(quote.get('quoteTimeInLong', 0)):
-                    continue
-                    
-                # Apply filters
-                if not self._apply_price_filter(quote):
-                    continue
-                
-                if not self._apply_spread_filter(quote):
-                    continue
-                
-                # Get price history
-                history = self._get_price_history_with_cache(symbol)
-                if not history:
-                    continue
-                
-                # 2. New: Anomaly Check
-                candles = history.get('candles', [])
-                if candles:
-                    prices = [c.get('close') for c in candles]
-                    if self.anomaly_detector.is_price_anomaly(quote.get('lastPrice', 0), prices):
-                        logger.warning(f"Rejecting {symbol}: Price anomaly detected")
-                        continue
-                
-                # Calculate ATR (Legacy method preserved for stability or can switch to library)
-                atr = self._calculate_atr(history)
-                if atr is None or atr < self.settings.min_atr:
-                    continue
-                
-                # Check volume
-                avg_volume = self._calculate_avg_volume(history)
-                if not self._apply_volume_filter(quote, avg_volume):
-                    continue
-                
-                # 3. New: RSI Check
-                item_rsi = 50.0  # Default
-                if len(candles) > 15:
-                    closes = pd.Series([c.get('close') for c in candles])
-                    rsi_series = TechnicalIndicators.calculate_rsi(closes)
-                    item_rsi = rsi_series.iloc[-1]
-                
-                # Analyze VWAP
-                vwap_bias = self._analyze_vwap(quote, history)
-                
-                # Filter by RSI (Basic logic: Don't buy if overbought > 70)
-                if item_rsi > 75 and vwap_bias == 'bullish':
-                     logger.debug(f"Skipping {symbol}: RSI {item_rsi:.1f} (Overbought)")
-                     continue
-                if item_rsi < 25 and vwap_bias == 'bearish':
-                     continue
-                
-                # Candidate passed all filters
-                candidate = {
-                    'symbol': symbol,
-                    'price': quote.get('lastPrice', 0),
-                    'bid': quote.get('bidPrice', 0),
-                    'ask': quote.get('askPrice', 0),
-                    'volume': quote.get('totalVolume', 0),
-                    'avg_volume': avg_volume,
-                    'atr': atr,
-                    'rsi': item_rsi,
-                    'vwap_bias': vwap_bias,
-                    'timestamp': datetime.now().isoformat()
-                }
-                
-                candidates.append(candidate)
-                logger.info(f"✓ {symbol}: ${quote.get('lastPrice', 0):.2f} | "
-                          f"ATR: {atr:.2f} | RSI: {item_rsi:.1f} | Bias: {vwap_bias}")
-                
-            except Exception as e:
-                logger.error(f"Error scanning {symbol}: {e}")
+            cached = self.cache.get_quote(symbol)
+            if cached:
+                quotes[symbol] = cached
+            else:
+                missing.append(symbol)
+        
+        for start in range(0, len(missing), QUOTE_BATCH_SIZE):
+            batch = missing[start:start + QUOTE_BATCH_SIZE]
+            fetched = self.client.get_quotes(batch)
+            
+            if not fetched:
+                # Batch endpoint failed; fall back to per-symbol requests
+                for symbol in batch:
+                    quote = self._get_quote_with_cache(symbol)
+                    if quote:
+                        quotes[symbol] = quote
                 continue
+            
+            for symbol in batch:
+                quote = fetched.get(symbol)
+                if quote:
+                    self.cache.set_quote(symbol, quote)
+                    quotes[symbol] = quote
         
-        logger.info(f"✓ Found {len(candidates)} candidates")
-        return candidates
+        return quotes
+    
+    def _filter_quotes(
+        self,
+        symbols: List[str],
+        quotes: Dict[str, Dict[str, Any]]
+    ) -> List[str]:
+        """
+        Apply freshness, price and spread filters across all quotes at once.
+        
+        Args:
+            symbols: Symbols in scan order
+            quotes: Dict of symbol -> quote
+            
+        Returns:
+            Symbols that passed, in scan order
+        """
+        symbols = [s for s in symbols if quotes.get(s)]
+        if not symbols:
+            return []
+        
+        n = len(symbols)
+        
+        def column(field: str) -> np.ndarray:
+            values = (quotes[s].get(field, 0) for s in symbols)
+            return np.fromiter((np.nan if v is None else v for v in values), dtype=np.float64, count=n)
+        
+        quote_time = column('quoteTimeInLong')
+        price = column('lastPrice')
+        bid = column('bidPrice')
+        ask = column('askPrice')
+        
+        # Freshness: TDA timestamps are epoch milliseconds
+        now_ms = time.time_ns() // 1_000_000
+        fresh = (quote_time > 0) & (now_ms - quote_time <= self.validator.max_age_ms)
+        if not fresh.all():
+            stale = [s for s, ok in zip(symbols, fresh) if not ok]
+            logger.warning(f"Data stale for {len(stale)} symbols (Limit: {self.validator.max_age_seconds}s): "
+                           f"{', '.join(stale[:10])}")
+        
+        # Price range
+        price_ok = (
+            np.isfinite(price) & (price > 0) &
+            (price >= self.settings.min_stock_price) & (price <= self.settings.max_stock_price)
+        )
+        
+        # Bid-ask spread as % of mid; invalid, crossed or infinite quotes never pass
+        spread_ok = calculate_spread_pct_batch(bid, ask) <= self.settings.max_stock_spread_pct
+        
+        keep = fresh & price_ok & spread_ok
+        return [s for s, ok in zip(symbols, keep) if ok]
+    
+    def _skip_cold_symbols(self, symbols: List[str]) -> List[str]:
+        """
+        Drop symbols whose cached stats are well below the ATR/volume thresholds.
+        
+        ATR and average volume move little within a trading day, so a symbol
+        that recently missed either threshold by a wide margin is skipped
+        without fetching its price history. Symbols without cached stats, or
+        near the thresholds, are kept and recomputed.
+        
+        Args:
+            symbols: Symbols that passed the quote filters
+            
+        Returns:
+            Symbols that still need full processing
+        """
+        min_atr = self.settings.min_atr * SCAN_STATS_SKIP_MARGIN
+        min_volume = self.settings.min_avg_volume * SCAN_STATS_SKIP_MARGIN
+        
+        kept = []
+        for symbol in symbols:
+            stats = self.cache.get_scan_stats(symbol, ttl_seconds=SCAN_STATS_TTL)
+            if stats and (stats['atr'] < min_atr or stats['avg_volume'] < min_volume):
+                continue
+            kept.append(symbol)
+        
+        skipped = len(symbols) - len(kept)
+        if skipped:
+            logger.debug(f"Skipped {skipped} symbols on cached stats")
+        
+        return kept
+    
+    def _process_symbol(self, symbol: str, quote: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Run history-based filters and indicators for one symbol.
+        
+        Args:
+            symbol: Stock ticker symbol
+            quote: Quote that already passed _filter_quotes
+            
+        Returns:
+            Candidate dictionary, or None if the symbol was filtered out
+        """
+        try:
+            # Get price history
+            history = self._get_price_history_with_cache(symbol)
+            if not history:
+                return None
+            
+            candles = history.get('candles', [])
+            
+            # Convert candles to arrays once for all indicator kernels
+            soa = self._candles_to_soa(candles)
+            
+            # 2. New: Anomaly Check
+            closes = soa['close']
+            if len(closes) >= MIN_HISTORY:
+                price = quote.get('lastPrice', 0)
+                mean = closes.mean(dtype=np.float64)
+                std = closes.std(dtype=np.float64)
+                if self.anomaly_detector.price_anomaly_mask(price, mean, std):
+                    if std:
+                        detail = f"Z-Score: {abs(price - mean) / std:.2f}"
+                    else:
+                        # Flat history: the percentage deviation rule fired
+                        detail = f"{abs(price - mean) / mean:.1%} from flat mean {mean:.2f}"
+                    logger.warning(f"Rejecting {symbol}: Price anomaly detected: {price} ({detail})")
+                    return None
+            
+            # Calculate ATR
+            atr = self._calculate_atr(soa)
+            if atr is None:
+                return None
+            
+            # Shared cumulative sums: every window average below is O(1)
+            windows = self._windows(soa)
+            avg_volume = self._calculate_avg_volume(windows)
+            
+            # 3. New: RSI Check
+            item_rsi = 50.0  # Default
+            if len(candles) > 15:
+                item_rsi = float(kernels.rsi_last(soa['close'], 14))
+            
+            # Record stats before filtering so rejected symbols are skipped next scan
+            self.cache.set_scan_stats(symbol, {
+                'atr': atr,
+                'avg_volume': avg_volume,
+                'rsi': item_rsi,
+                'computed_at': datetime.now().isoformat()
+            })
+            
+            if atr < self.settings.min_atr:
+                return None
+            
+            # Check volume
+            if not self._apply_volume_filter(quote, avg_volume):
+                return None
+            
+            # Analyze VWAP
+            vwap_bias = self._analyze_vwap(quote, windows)
+            
+            # Filter by RSI (Basic logic: Don't buy if overbought > 70)
+            if item_rsi > 75 and vwap_bias == 'bullish':
+                logger.debug(f"Skipping {symbol}: RSI {item_rsi:.1f} (Overbought)")
+                return None
+            if item_rsi < 25 and vwap_bias == 'bearish':
+                return None
+            
+            # Candidate passed all filters
+            candidate = {
+                'symbol': symbol,
+                'price': quote.get('lastPrice', 0),
+                'bid': quote.get('bidPrice', 0),
+                'ask': quote.get('askPrice', 0),
+                'volume': quote.get('totalVolume', 0),
+                'avg_volume': avg_volume,
+                'atr': atr,
+                'rsi': item_rsi,
+                'vwap_bias': vwap_bias,
+                'timestamp': datetime.now().isoformat()
+            }
+            
+            logger.info(f"✓ {symbol}: ${quote.get('lastPrice', 0):.2f} | "
+                        f"ATR: {atr:.2f} | RSI: {item_rsi:.1f} | Bias: {vwap_bias}")
+            
+            return candidate
+            
+        except Exception as e:
+            logger.error(f"Error scanning {symbol}: {e}")
+            return None
     
     def _get_quote_with_cache(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Get quote with caching."""
@@ -135,7 +334,14 @@ class MarketScanner:
         if cached:
             return cached
         
-        # Fetch from API
+        return self._single_flight.do(
+            f"quote:{symbol}",
+            lambda: self.cache.get_quote(symbol),
+            lambda: self._fetch_quote(symbol)
+        )
+    
+    def _fetch_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Fetch quote from API and populate cache."""
         quote = self.client.get_quote(symbol)
         if quote:
             self.cache.set_quote(symbol, quote)
@@ -149,6 +355,14 @@ class MarketScanner:
         if cached:
             return cached
         
+        return self._single_flight.do(
+            f"history:{symbol}",
+            lambda: self.cache.get_price_history(symbol),
+            lambda: self._fetch_price_history(symbol)
+        )
+    
+    def _fetch_price_history(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Fetch price history from API and populate cache."""
         # Fetch from API (last 20 days for ATR calculation)
         history = self.client.get_price_history(
             symbol,
@@ -163,26 +377,6 @@ class MarketScanner:
         
         return history
     
-    def _apply_price_filter(self, quote: Dict[str, Any]) -> bool:
-        """Filter by price range."""
-        price = quote.get('lastPrice', 0)
-        
-        if not is_valid_price(price):
-            return False
-        
-        return self.settings.min_stock_price <= price <= self.settings.max_stock_price
-    
-    def _apply_spread_filter(self, quote: Dict[str, Any]) -> bool:
-        """Filter by bid-ask spread."""
-        bid = quote.get('bidPrice', 0)
-        ask = quote.get('askPrice', 0)
-        
-        if not is_valid_price(bid) or not is_valid_price(ask):
-            return False
-        
-        spread_pct = calculate_spread_pct(bid, ask)
-        return spread_pct <= self.settings.max_stock_spread_pct
-    
     def _apply_volume_filter(self, quote: Dict[str, Any], avg_volume: float) -> bool:
         """Filter by volume criteria."""
         current_volume = quote.get('totalVolume', 0)
@@ -197,87 +391,151 @@ class MarketScanner:
         
         return True
     
-    def _calculate_atr(self, history: Dict[str, Any], period: int = 14) -> Optional[float]:
+    def _scratch_buffers(self, n: int) -> Dict[str, np.ndarray]:
         """
-        Calculate Average True Range (ATR).
+        Get this worker thread's scratch arrays, growing them only when needed.
         
         Args:
-            history: Price history data
-            period: ATR period (default: 14)
+            n: Number of candles that must fit
             
         Returns:
-            ATR value or None if insufficient data
+            Dict of reusable buffers with capacity >= n (cumsums: n + 1)
         """
-        candles = history.get('candles', [])
-        
-        if len(candles) < period + 1:
-            return None
-        
-        # Convert to DataFrame
-        df = pd.DataFrame(candles)
+        buffers = getattr(self._scratch, 'buffers', None)
+        if buffers is None or len(buffers['close']) < n:
+            size = max(n, SCRATCH_SIZE)
+            buffers = {
+                'high': np.empty(size, dtype=np.float32),
+                'low': np.empty(size, dtype=np.float32),
+                'close': np.empty(size, dtype=np.float32),
+                'volume': np.empty(size, dtype=np.uint32),
+                'tp_volume': np.empty(size, dtype=np.float64),
+                'cs_volume': np.zeros(size + 1, dtype=np.float64),
+                'cs_tp_volume': np.zeros(size + 1, dtype=np.float64),
+            }
+            self._scratch.buffers = buffers
+        return buffers
+    
+    def _candles_to_soa(self, candles: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """
+        Convert candle dicts to a structure of contiguous arrays.
         
-        # Calculate True Range
-        df['high_low'] = df['high'] - df['low']
-        df['high_close'] = abs(df['high'] - df['close'].shift())
-        df['low_close'] = abs(df['low'] - df['close'].shift())
+        Prices are stored as float32 and volumes as uint32 to halve memory
+        traffic; the kernels accumulate in float64. The arrays are views into
+        per-thread scratch buffers, valid until the next symbol on this thread.
         
-        df['true_range'] = df[['high_low', 'high_close', 'low_close']].max(axis=1)
+        Args:
+            candles: Price history candles
+            
+        Returns:
+            Dict of 'high', 'low', 'close' (float32) and 'volume' (uint32) arrays
+        """
+        n = len(candles)
+        buffers = self._scratch_buffers(n)
+        
+        # None prices become NaN rather than a fake 0; None volumes count as 0
+        soa = {}
+        for field, none_value in (('high', np.nan), ('low', np.nan), ('close', np.nan), ('volume', 0)):
+            column = buffers[field][:n]
+            column[:] = self._candle_column(candles, field, none_value, n)
+            soa[field] = column
+        return soa
+    
+    @staticmethod
+    def _candle_column(
+        candles: List[Dict[str, Any]],
+        field: str,
+        none_value: float,
+        n: int
+    ) -> np.ndarray:
+        """float64 column of one candle field (missing -> 0, None -> none_value)."""
+        return np.fromiter(
+            (none_value if (value := c.get(field, 0)) is None else value for c in candles),
+            dtype=np.float64,
+            count=n
+        )
+    
+    def _calculate_atr(self, soa: Dict[str, np.ndarray], period: int = 14) -> Optional[float]:
+        """
+        Calculate Average True Range (ATR).
         
-        # Calculate ATR
-        atr = df['true_range'].rolling(window=period).mean().iloc[-1]
+        Args:
+            soa: Candle arrays from _candles_to_soa
+            period: ATR period (default: 14)
+            
+        Returns:
+            ATR value or None if insufficient data
+        """
+        atr = kernels.atr_last(soa['high'], soa['low'], soa['close'], period)
+        return float(atr) if not np.isnan(atr) else None
+    
+    def _windows(self, soa: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Build zero-prefixed cumulative sums for trailing-window averages.
         
-        return float(atr) if not pd.isna(atr) else None
+        Args:
+            soa: Candle arrays from _candles_to_soa
+            
+        Returns:
+            Dict of 'volume' and 'tp_volume' (typical price x volume) cumsums
+        """
+        n = len(soa['close'])
+        buffers = self._scratch_buffers(n)
+        cs_volume = buffers['cs_volume'][:n + 1]
+        cs_tp_volume = buffers['cs_tp_volume'][:n + 1]
+        tp_volume = buffers['tp_volume'][:n]
+        
+        # Typical price x volume, computed in place
+        np.add(soa['high'], soa['low'], out=tp_volume)
+        np.add(tp_volume, soa['close'], out=tp_volume)
+        np.divide(tp_volume, 3, out=tp_volume)
+        np.multiply(tp_volume, soa['volume'], out=tp_volume)
+        
+        # Index 0 of each cumsum buffer stays 0.0
+        np.cumsum(soa['volume'], out=cs_volume[1:], dtype=np.float64)
+        np.cumsum(tp_volume, out=cs_tp_volume[1:])
+        return {'volume': cs_volume, 'tp_volume': cs_tp_volume}
+    
+    @staticmethod
+    def _window_sum(cumsum: np.ndarray, period: int) -> float:
+        """Sum of the last `period` values (or all, if fewer) from a zero-prefixed cumsum."""
+        n = min(period, len(cumsum) - 1)
+        return float(cumsum[-1] - cumsum[-1 - n])
     
-    def _calculate_avg_volume(self, history: Dict[str, Any], period: int = 20) -> float:
+    def _calculate_avg_volume(self, windows: Dict[str, np.ndarray], period: int = 20) -> float:
         """
         Calculate average volume.
         
         Args:
-            history: Price history data
+            windows: Cumulative sums from _windows
             period: Averaging period
             
         Returns:
             Average volume
         """
-        candles = history.get('candles', [])
-        
-        if not candles:
-            return 0
-        
-        volumes = [c.get('volume', 0) for c in candles[-period:]]
-        return np.mean(volumes) if volumes else 0
+        n = min(period, len(windows['volume']) - 1)
+        return self._window_sum(windows['volume'], n) / n if n > 0 else 0
     
-    def _analyze_vwap(self, quote: Dict[str, Any], history: Dict[str, Any]) -> str:
+    def _analyze_vwap(self, quote: Dict[str, Any], windows: Dict[str, np.ndarray]) -> str:
         """
         Analyze price relationship to VWAP.
         
         Args:
             quote: Current quote data
-            history: Price history data
+            windows: Cumulative sums from _windows
             
         Returns:
             'bullish', 'bearish', or 'neutral'
         """
         current_price = quote.get('lastPrice', 0)
         
-        # Calculate VWAP from today's data
-        candles = history.get('candles', [])
-        if not candles:
-            return 'neutral'
-        
-        # Use last candle as proxy for intraday VWAP
+        # Use last 5 daily candles as proxy for intraday VWAP
         # In production, you'd want intraday minute data
-        recent_candles = candles[-5:]  # Last 5 days
-        
-        total_volume = sum(c.get('volume', 0) for c in recent_candles)
+        total_volume = self._window_sum(windows['volume'], 5)
         if total_volume == 0:
             return 'neutral'
         
-        # Weighted average price
-        vwap = sum(
-            ((c.get('high', 0) + c.get('low', 0) + c.get('close', 0)) / 3) * c.get('volume', 0)
-            for c in recent_candles
-        ) / total_volume
+        vwap = self._window_sum(windows['tp_volume'], 5) / total_volume
         
         # Determine bias
         threshold = 0.005  # 0.5% threshold
@@ -291,39 +549,102 @@ class MarketScanner:
             return 'neutral'
 
 
-def get_default_symbols() -> List[str]:
+# Sector codes for the scan universe (index = code stored in the 'sector' field)
+SECTORS = (
+    'Tech', 'Finance', 'Healthcare', 'Consumer', 'Energy', 'Industrial',
+    'Communication', 'Retail', 'Semiconductor', 'Software', 'Auto', 'Biotech', 'ETF'
+)
+
+# Popular liquid stocks across sectors, in priority order
+_DEFAULT_UNIVERSE_BY_SECTOR = {
+    'Tech': ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'META', 'NVDA', 'TSLA', 'AMD', 'INTC', 'NFLX'],
+    'Finance': ['JPM', 'BAC', 'WFC', 'GS', 'MS', 'C'],
+    'Healthcare': ['JNJ', 'UNH', 'PFE', 'ABBV', 'TMO', 'MRK'],
+    'Consumer': ['WMT', 'HD', 'DIS', 'NKE', 'SBUX', 'MCD'],
+    'Energy': ['XOM', 'CVX', 'COP', 'SLB'],
+    'Industrial': ['BA', 'CAT', 'GE', 'UPS'],
+    'Communication': ['T', 'VZ', 'CMCSA'],
+    'Retail': ['TGT', 'COST', 'LOW'],
+    'Semiconductor': ['AVGO', 'QCOM', 'TXN', 'AMAT'],
+    'Software': ['CRM', 'ORCL', 'ADBE', 'NOW'],
+    'Auto': ['F', 'GM'],
+    'Biotech': ['GILD', 'AMGN', 'BIIB'],
+    'ETF': ['SPY', 'QQQ', 'IWM', 'DIA'],  # High volume
+}
+
+UNIVERSE_DTYPE = np.dtype([('symbol', 'S8'), ('sector', 'u1')])
+
+# Built once at import; callers receive views, never fresh Python lists
+_DEFAULT_UNIVERSE = np.array(
+    [
+        (symbol.encode('ascii'), SECTORS.index(sector))
+        for sector, symbols in _DEFAULT_UNIVERSE_BY_SECTOR.items()
+        for symbol in symbols
+    ],
+    dtype=UNIVERSE_DTYPE
+)
+
+
+@lru_cache(maxsize=4)
+def _load_universe_file(path: str) -> np.ndarray:
+    """Memory-map a universe file saved with np.save."""
+    universe = np.load(path, mmap_mode='r')
+    missing = {'symbol', 'sector'} - set(universe.dtype.names or ())
+    if missing:
+        raise ValueError(f"Universe file {path} missing fields: {sorted(missing)}")
+    return universe
+
+
+def get_universe(
+    sector: Optional[str] = None,
+    top_n: Optional[int] = None,
+    path: Optional[str] = None
+) -> np.ndarray:
+    """
+    Get the scan universe as a structured array.
+    
+    Args:
+        sector: Restrict to one sector name from SECTORS
+        top_n: Keep only the first N symbols (by 'adv' descending if the
+            universe has an average dollar volume field, else priority order)
+        path: Optional .npy universe file (fields: symbol S8, sector u1,
+            optional adv f4); memory-mapped so slices don't load the whole file
+            
+    Returns:
+        Structured array with 'symbol' and 'sector' fields
+    """
+    universe = _load_universe_file(path) if path else _DEFAULT_UNIVERSE
+    
+    if sector is not None:
+        if sector not in SECTORS:
+            raise ValueError(f"Unknown sector '{sector}'. Expected one of {SECTORS}")
+        universe = universe[universe['sector'] == SECTORS.index(sector)]
+    
+    if top_n is not None:
+        if 'adv' in universe.dtype.names:
+            order = np.argsort(-universe['adv'], kind='stable')[:top_n]
+            universe = universe[order]
+        else:
+            universe = universe[:top_n]
+    
+    return universe
+
+
+def get_default_symbols(
+    sector: Optional[str] = None,
+    top_n: Optional[int] = None,
+    path: Optional[str] = None
+) -> List[str]:
     """
     Get default list of liquid symbols to scan.
     
+    Args:
+        sector: Restrict to one sector name from SECTORS
+        top_n: Keep only the top N symbols
+        path: Optional .npy universe file to use instead of the built-in list
+        
     Returns:
         List of ticker symbols
     """
-    # Popular liquid stocks across sectors
-    return [
-        # Tech
-        'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'META', 'NVDA', 'TSLA', 'AMD', 'INTC', 'NFLX',
-        # Finance
-        'JPM', 'BAC', 'WFC', 'GS', 'MS', 'C',
-        # Healthcare
-        'JNJ', 'UNH', 'PFE', 'ABBV', 'TMO', 'MRK',
-        # Consumer
-        'WMT', 'HD', 'DIS', 'NKE', 'SBUX', 'MCD',
-        # Energy
-        'XOM', 'CVX', 'COP', 'SLB',
-        # Industrial
-        'BA', 'CAT', 'GE', 'UPS',
-        # Communication
-        'T', 'VZ', 'CMCSA',
-        # Retail
-        'TGT', 'COST', 'LOW',
-        # Semiconductor
-        'AVGO', 'QCOM', 'TXN', 'AMAT',
-        # Software
-        'CRM', 'ORCL', 'ADBE', 'NOW',
-        # Auto
-        'F', 'GM',
-        # Biotech
-        'GILD', 'AMGN', 'BIIB',
-        # ETFs (high volume)
-        'SPY', 'QQQ', 'IWM', 'DIA'
-    ]
+    universe = get_universe(sector=sector, top_n=top_n, path=path)
+    return np.char.decode(universe['symbol'], 'ascii').tolist()
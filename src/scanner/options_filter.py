@@ -1,16 +1,57 @@
 """Options liquidity filter for identifying tradable options."""
 
-from typing import List, Dict, Any, Optional
+import bisect
+import threading
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import numpy as np
 
 from config.settings import get_settings
 from src.data import get_client, get_cache
 from src.utils.logger import get_logger
-from src.utils.validators import validate_option_data, calculate_spread_pct
+from src.utils.validators import validate_option_arrays
+from src.utils.single_flight import SingleFlight
 
 
 logger = get_logger(__name__)
 
+# Max concurrent option chain fetches in filter_options_batch
+CHAIN_FETCH_WORKERS = 10
+
+# Columns built from each contract for vectorized filtering
+_TABLE_FIELDS = ('strike', 'oi', 'volume', 'bid', 'ask', 'iv', 'delta', 'gamma', 'theta', 'vega', 'dte')
+
+# Columns exposed as calls_soa/puts_soa, row-aligned with calls/puts;
+# each also carries a derived 'mid' column ((bid + ask) / 2)
+SOA_FIELDS = ('strike', 'bid', 'ask', 'oi', 'volume', 'delta', 'iv', 'dte')
+
+# Chain cache TTLs: quotes move during the trading week, not on weekends
+CHAIN_TTL_INTRADAY = timedelta(minutes=15)
+CHAIN_TTL_WEEKEND = timedelta(hours=4)
+
+# An expired chain is served while it refreshes in the background only
+# within this window; older chains are refetched synchronously
+CHAIN_MAX_STALE = timedelta(minutes=15)
+
+
+@lru_cache(maxsize=1024)
+def _parse_expiration(exp_date_str: str) -> datetime:
+    """
+    Parse an expDateMap key like '2024-01-19:3' into its expiration date.
+    
+    Expiration keys repeat across symbols and scans, so each is parsed once.
+    
+    Args:
+        exp_date_str: Expiration key from callExpDateMap/putExpDateMap
+        
+    Returns:
+        Expiration date at midnight
+    """
+    return datetime.strptime(exp_date_str.partition(':')[0], '%Y-%m-%d')
+
 
 class OptionsFilter:
     """Filter options chains for liquid, tradable contracts."""
@@ -20,6 +61,14 @@ class OptionsFilter:
         self.settings = get_settings()
         self.client = get_client()
         self.cache = get_cache()
+        
+        # Collapse concurrent cache misses into one API call per symbol
+        self._single_flight = SingleFlight()
+        
+        # Liquidity limits, read once for _liquid_mask
+        self._min_oi = self.settings.min_open_interest
+        self._min_option_volume = self.settings.min_option_volume
+        self._max_spread_factor = self.settings.max_option_spread_pct
     
     def filter_options(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
@@ -29,23 +78,56 @@ class OptionsFilter:
             symbol: Stock ticker symbol
             
         Returns:
-            Dictionary with filtered calls and puts, or None if no liquid options
+            Dictionary with filtered calls and puts, or None if no liquid options.
+            'calls' and 'puts' are lists of contract dicts; 'calls_soa' and
+            'puts_soa' hold the same rows as NumPy arrays keyed by SOA_FIELDS
+            plus 'mid', and should be preferred by new numeric consumers.
+        """
+        return self.filter_options_batch([symbol]).get(symbol)
+    
+    def filter_options_batch(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get and filter options chains for several symbols.
+        
+        Chains missing from the cache are fetched concurrently; the client's
+        rate limiter still spaces out the actual requests.
+        
+        Args:
+            symbols: Stock ticker symbols
+            
+        Returns:
+            Dictionary of symbol to filtered options, in input order. Symbols
+            without chain data or liquid options are omitted.
         """
+        chains = self._get_option_chains_with_cache(symbols)
+        
+        results = {}
+        for symbol in symbols:
+            filtered = self._filter_chain(symbol, chains.get(symbol))
+            if filtered:
+                results[symbol] = filtered
+        
+        return results
+    
+    def _filter_chain(
+        self,
+        symbol: str,
+        chain: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """Filter one symbol's chain into liquid calls and puts."""
         logger.info(f"📊 Filtering options for {symbol}...")
         
-        # Get options chain
-        chain = self._get_option_chain_with_cache(symbol)
         if not chain:
             logger.warning(f"No options chain data for {symbol}")
             return None
         
         # Filter calls and puts
-        filtered_calls = self._filter_contracts(
+        filtered_calls, calls_soa = self._filter_contracts(
             chain.get('callExpDateMap', {}),
             'CALL'
         )
         
-        filtered_puts = self._filter_contracts(
+        filtered_puts, puts_soa = self._filter_contracts(
             chain.get('putExpDateMap', {}),
             'PUT'
         )
@@ -62,16 +144,110 @@ class OptionsFilter:
             'underlying_price': chain.get('underlyingPrice', 0),
             'calls': filtered_calls,
             'puts': filtered_puts,
+            'calls_soa': calls_soa,
+            'puts_soa': puts_soa,
             'timestamp': datetime.now().isoformat()
         }
     
+    def _get_option_chains_with_cache(
+        self,
+        symbols: List[str]
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Get option chains for several symbols, fetching misses concurrently."""
+        chains = {}
+        misses = []
+        for symbol in dict.fromkeys(symbols):
+            cached = self._servable_chain(symbol, self.cache.get_option_chain_entry(symbol))
+            if cached:
+                chains[symbol] = cached
+            else:
+                misses.append(symbol)
+        
+        if len(misses) == 1:
+            chains[misses[0]] = self._fetch_option_chain_once(misses[0])
+        elif misses:
+            workers = min(CHAIN_FETCH_WORKERS, len(misses))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    symbol: pool.submit(self._fetch_option_chain_once, symbol)
+                    for symbol in misses
+                }
+                for symbol, future in futures.items():
+                    try:
+                        chains[symbol] = future.result()
+                    except Exception as e:
+                        logger.error(f"Error fetching options chain for {symbol}: {e}")
+                        chains[symbol] = None
+        
+        return chains
+    
     def _get_option_chain_with_cache(self, symbol: str) -> Optional[Dict[str, Any]]:
-        """Get option chain with caching."""
+        """
+        Get option chain with caching.
+        
+        A recently expired chain is returned immediately while a background
+        thread refreshes it (stale-while-revalidate).
+        """
         # Check cache first
-        cached = self.cache.get_option_chain(symbol)
-        if cached:
-            return cached
+        chain = self._servable_chain(symbol, self.cache.get_option_chain_entry(symbol))
+        if chain:
+            return chain
+        
+        return self._fetch_option_chain_once(symbol)
+    
+    def _servable_chain(
+        self,
+        symbol: str,
+        entry: Optional[Tuple[Dict[str, Any], datetime]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Chain from a cache entry if it is fresh or only recently expired.
+        
+        A recently expired chain is still returned, and a background
+        refresh is started for it.
+        
+        Args:
+            symbol: Stock ticker symbol
+            entry: (chain, expires_at) from cache.get_option_chain_entry, or None
+            
+        Returns:
+            Cached chain, or None if it must be fetched
+        """
+        if not entry:
+            return None
+        
+        chain, expires_at = entry
+        now = datetime.now()
+        if now < expires_at:
+            return chain
+        if now - expires_at <= CHAIN_MAX_STALE:
+            self._refresh_in_background(symbol)
+            return chain
+        return None
+    
+    def _fetch_option_chain_once(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Fetch a chain, sharing one API call among concurrent callers."""
+        return self._single_flight.do(
+            f"chain:{symbol}",
+            lambda: self.cache.get_option_chain(symbol),
+            lambda: self._fetch_option_chain(symbol)
+        )
+    
+    def _refresh_in_background(self, symbol: str):
+        """Refetch a stale chain on a daemon thread unless a fetch is already in flight."""
+        if self._single_flight.in_flight(f"chain:{symbol}"):
+            return
+        
+        def refresh():
+            try:
+                self._fetch_option_chain_once(symbol)
+            except Exception as e:
+                logger.error(f"Background refresh of options chain for {symbol} failed: {e}")
         
+        threading.Thread(target=refresh, name=f"chain-refresh-{symbol}", daemon=True).start()
+    
+    def _fetch_option_chain(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Fetch option chain from API and populate cache."""
         # Calculate date range for DTE filter
         from_date = datetime.now()
         to_date = from_date + timedelta(days=self.settings.max_dte)
@@ -80,81 +256,140 @@ class OptionsFilter:
         chain = self.client.get_option_chain(symbol, from_date, to_date)
         
         if chain:
-            self.cache.set_option_chain(symbol, chain)
+            # Sorted call strikes per expiration, for bisect in get_atm_strike
+            chain['_sorted_strikes'] = {
+                exp_key: sorted(float(strike) for strike in strike_map)
+                for exp_key, strike_map in chain.get('callExpDateMap', {}).items()
+            }
+            self.cache.set_option_chain(symbol, chain, ttl=self._calculate_chain_ttl(from_date))
         
         return chain
     
+    @staticmethod
+    def _calculate_chain_ttl(now: datetime) -> timedelta:
+        """
+        Pick a cache TTL matching how often the chain can change.
+        
+        Args:
+            now: Time the chain was fetched
+            
+        Returns:
+            15 minutes on weekdays, 4 hours on weekends
+        """
+        if now.weekday() >= 5:
+            return CHAIN_TTL_WEEKEND
+        return CHAIN_TTL_INTRADAY
+    
     def _filter_contracts(
         self,
         exp_date_map: Dict[str, Any],
         option_type: str
-    ) -> List[Dict[str, Any]]:
-        """Filter option contracts by liquidity criteria."""
-        filtered = []
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, np.ndarray]]:
+        """
+        Filter option contracts by liquidity criteria.
+        
+        Returns:
+            Tuple of (liquid contracts, their SOA_FIELDS and 'mid' arrays)
+        """
+        contracts = []
+        now = datetime.now()
+        min_dte, max_dte = self.settings.min_dte, self.settings.max_dte
         
         for exp_date_str, strike_map in exp_date_map.items():
             try:
-                exp_date = datetime.strptime(exp_date_str.split(':')[0], '%Y-%m-%d')
-                dte = (exp_date - datetime.now()).days
+                exp_date = _parse_expiration(exp_date_str)
+                dte = (exp_date - now).days
                 
-                if not (self.settings.min_dte <= dte <= self.settings.max_dte):
+                if not (min_dte <= dte <= max_dte):
                     continue
                 
             except Exception as e:
                 logger.error(f"Error parsing expiration date {exp_date_str}: {e}")
                 continue
             
-            for strike_str, contracts in strike_map.items():
-                for contract_data in contracts:
+            for strike_contracts in strike_map.values():
+                for contract_data in strike_contracts:
                     # Enrich data before validation
                     contract_data['dte'] = dte
                     contract_data['expiration_date'] = exp_date 
                     contract_data['option_type'] = option_type
-                    
-                    if self._is_liquid_contract(contract_data):
-                        # Store essential data
-                        filtered.append(contract_data)
+                    contracts.append(contract_data)
         
-        return filtered
+        soa = self._contracts_to_soa(contracts)
+        keep = np.flatnonzero(self._liquid_mask(soa))
+        
+        filtered = [contracts[i] for i in keep]
+        filtered_soa = {field: soa[field][keep] for field in SOA_FIELDS}
+        filtered_soa['mid'] = 0.5 * (filtered_soa['bid'] + filtered_soa['ask'])
+        return filtered, filtered_soa
     
-    def _is_liquid_contract(self, contract: Dict[str, Any]) -> bool:
-        """Check if option contract meets liquidity requirements."""
-        # Validate basic data structure
-        if not validate_option_data(contract):
-            return False
-            
-        # Basic liquidity checks
-        if contract.get('openInterest', 0) < self.settings.min_open_interest:
-            return False
-            
-        if contract.get('totalVolume', 0) < self.settings.min_option_volume:
-            return False
-            
-        # Spread check
-        bid = contract.get('bid', 0)
-        ask = contract.get('ask', 0)
-        if bid <= 0 or ask <= 0:
-            return False
-            
-        spread_pct = calculate_spread_pct(bid, ask)
-        if spread_pct > self.settings.max_option_spread_pct:
-            return False
-            
-        # Greeks check
-        greeks = contract.get('greeks', {})
-        if not greeks or greeks.get('delta') is None:
-            return False
+    @staticmethod
+    def _contracts_to_soa(contracts: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """
+        Convert contracts to a dictionary of float64 column arrays.
+        
+        Missing or None fields become NaN and fail every liquidity comparison.
+        
+        Args:
+            contracts: Option contracts
             
-        # Implied Volatility check (New Robustness Feature)
-        iv = contract.get('volatility', 0) 
-        # Note: TDA returns volatility as a percentage (e.g. 25.0) or straight number? 
-        # Usually 'volatility' field in TDA is IV.
-        if iv <= 0 or iv == float('nan'):
-            # Try to get from greeks if main field missing? 
-            # Often it's top level. Let's assume strictness for now.
-            return False
+        Returns:
+            Dictionary of field name to array, one row per contract
+        """
+        rows = []
+        for contract in contracts:
+            greeks = contract.get('greeks') or {}
+            rows.append((
+                contract.get('strikePrice'),
+                contract.get('openInterest'),
+                contract.get('totalVolume'),
+                contract.get('bid'),
+                contract.get('ask'),
+                contract.get('volatility', 0),
+                greeks.get('delta'),
+                greeks.get('gamma', 0),
+                greeks.get('theta', 0),
+                greeks.get('vega', 0),
+                contract.get('dte')
+            ))
+        table = np.array(rows, dtype=np.float64).reshape(len(rows), len(_TABLE_FIELDS))
+        
+        return {field: table[:, i] for i, field in enumerate(_TABLE_FIELDS)}
+    
+    def _liquid_mask(self, soa: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Check contract columns against the liquidity requirements.
+        
+        Args:
+            soa: Contract columns from _contracts_to_soa
             
-        return True
+        Returns:
+            Boolean array, True where the contract meets liquidity requirements
+        """
+        oi = soa['oi']
+        volume = soa['volume']
+        bid = soa['bid']
+        ask = soa['ask']
+        iv = soa['iv']
+        
+        # Spread as % of mid within max, without dividing:
+        # (ask - bid) / ((ask + bid) / 2) * 100 <= max  <=>  200 * (ask - bid) <= max * (ask + bid)
+        with np.errstate(invalid='ignore'):
+            spread_ok = 200.0 * (ask - bid) <= self._max_spread_factor * (ask + bid)
+        
+        valid = validate_option_arrays(
+            bid, ask, oi, volume,
+            soa['delta'], soa['gamma'], soa['theta'], soa['vega']
+        )
+        
+        return (
+            (oi >= self._min_oi) &
+            (volume >= self._min_option_volume) &
+            (ask >= bid) &
+            spread_ok &
+            valid &
+            np.isfinite(iv) & (iv > 0)
+        )
 
     def get_atm_strike(self, symbol: str, underlying_price: float) -> Optional[float]:
         """Find at-the-money strike price."""
@@ -167,15 +402,24 @@ class OptionsFilter:
         if not call_map:
             return None
         
-        # Get strikes from first expiration
-        first_exp = next(iter(call_map.values()))
-        strikes = [float(strike) for strike in first_exp.keys()]
+        # Get sorted strikes from first expiration
+        first_exp_key, first_exp = next(iter(call_map.items()))
+        strikes = chain.get('_sorted_strikes', {}).get(first_exp_key)
+        if strikes is None:
+            strikes = sorted(float(strike) for strike in first_exp.keys())
         
         if not strikes:
             return None
         
-        # Find closest strike to underlying price
-        atm_strike = min(strikes, key=lambda x: abs(x - underlying_price))
+        # Find closest strike to underlying price; ties go to the lower strike
+        i = bisect.bisect_left(strikes, underlying_price)
+        if i == 0:
+            return strikes[0]
+        if i == len(strikes):
+            return strikes[-1]
+        
+        lower, upper = strikes[i - 1], strikes[i]
+        atm_strike = lower if underlying_price - lower <= upper - underlying_price else upper
         return atm_strike
     
     def get_contracts_by_delta(
@@ -1,5 +1,5 @@
 """Scoring package initialization."""
 
-from .trade_scorer import TradeScorer
+from .trade_scorer import ScoredTrade, TradeScorer
 
-__all__ = ['TradeScorer']
+__all__ = ['ScoredTrade', 'TradeScorer']
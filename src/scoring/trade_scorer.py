@@ -1,15 +1,73 @@
 """Trade scoring and ranking system."""
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+import logging
 import math
+from dataclasses import dataclass, field
+from itertools import chain
+
+import numpy as np
 
 from config.settings import get_settings
 from src.utils.logger import get_logger
 from src.analytics import ProbabilityCalculator, RiskMetrics
+from src.strategies.strategy_configs import Trade
 
 
 logger = get_logger(__name__)
 
+# IV edge score by (strategy kind, condition kind); '*' matches any condition
+_IV_EDGE_TABLE = {
+    ('debit', 'breakout'): 80.0,  # Low IV is good
+    ('debit', '*'): 60.0,
+    ('credit', 'high_iv'): 80.0,  # High IV is good
+    ('credit', 'choppy'): 80.0,
+    ('credit', '*'): 60.0,
+}
+
+# Trend alignment score by (condition kind, bias); '*' matches any bias
+_TREND_TABLE = {
+    ('strong', '*'): 90.0,
+    ('breakout', '*'): 80.0,
+    ('high_iv', '*'): 70.0,
+    ('choppy', 'neutral'): 75.0,
+    ('choppy', '*'): 50.0,
+}
+
+
+def _strategy_kind(strategy: str) -> str:
+    """Classify a strategy name as 'debit', 'credit' or 'other'."""
+    if 'Debit' in strategy or 'Long' in strategy:
+        return 'debit'
+    if 'Credit' in strategy or 'Condor' in strategy:
+        return 'credit'
+    return 'other'
+
+
+def _condition_kind(condition: str) -> str:
+    """Classify a market condition value by its keyword."""
+    for keyword in ('strong', 'breakout', 'high_iv', 'choppy'):
+        if keyword in condition:
+            return keyword
+    return 'other'
+
+
+@dataclass(slots=True)
+class ScoredTrade:
+    """Selected trade with the metrics and score computed for it."""
+    trade: Trade
+    probability_metrics: Dict[str, Any] = field(default_factory=dict)
+    risk_metrics: Dict[str, Any] = field(default_factory=dict)
+    score: float = 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the trade dictionary written to outputs and the cache."""
+        trade = self.trade.to_dict()
+        trade['probability_metrics'] = self.probability_metrics
+        trade['risk_metrics'] = self.risk_metrics
+        trade['score'] = self.score
+        return trade
+
 
 class TradeScorer:
     """Score and rank trades based on multiple criteria."""
@@ -17,10 +75,23 @@ class TradeScorer:
     def __init__(self):
         """Initialize trade scorer."""
         self.settings = get_settings()
+        
+        # Weights are fixed once settings load; capture them as locals
+        wp, wrr, wiv, wl, wt = (
+            self.settings.weight_probability,
+            self.settings.weight_risk_reward,
+            self.settings.weight_iv_edge,
+            self.settings.weight_liquidity,
+            self.settings.weight_trend
+        )
+        self._combine = lambda p, rr, iv, l, t: wp * p + wrr * rr + wiv * iv + wl * l + wt * t
+        
+        # Same weights as a vector for batch scoring (columns: P, RR, IV, L, T)
+        self._weights = np.array([wp, wrr, wiv, wl, wt], dtype=np.float64)
     
     def score_trade(
         self,
-        trade: Dict[str, Any],
+        trade: Trade,
         probability_metrics: Dict[str, Any],
         risk_metrics: Dict[str, Any],
         options_data: Dict[str, Any]
@@ -45,20 +116,82 @@ class TradeScorer:
         trend_score = self._score_trend_alignment(trade)
         
         # Weighted composite score
-        total_score = (
-            self.settings.weight_probability * prob_score +
-            self.settings.weight_risk_reward * rr_score +
-            self.settings.weight_iv_edge * iv_score +
-            self.settings.weight_liquidity * liquidity_score +
-            self.settings.weight_trend * trend_score
-        )
+        total_score = self._combine(prob_score, rr_score, iv_score, liquidity_score, trend_score)
         
-        logger.debug(f"{trade['symbol']}: P={prob_score:.1f} RR={rr_score:.1f} "
-                    f"IV={iv_score:.1f} L={liquidity_score:.1f} T={trend_score:.1f} "
-                    f"→ Total={total_score:.1f}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"{trade.symbol}: P={prob_score:.1f} RR={rr_score:.1f} "
+                        f"IV={iv_score:.1f} L={liquidity_score:.1f} T={trend_score:.1f} "
+                        f"→ Total={total_score:.1f}")
         
         return round(total_score, 1)
     
+    def score_trades(
+        self,
+        trades: List[Trade],
+        probability_metrics: List[Dict[str, Any]],
+        risk_metrics: List[Dict[str, Any]],
+        options_data: List[Dict[str, Any]]
+    ) -> List[float]:
+        """
+        Calculate composite scores for many trades at once (0-100 each).
+        
+        Equivalent to calling score_trade per trade, but the probability,
+        risk/reward and liquidity scores and the weighted sum are computed
+        as arrays.
+        
+        Args:
+            trades: Trade structures
+            probability_metrics: Probability calculations, one per trade
+            risk_metrics: Risk metrics, one per trade
+            options_data: Options data for liquidity scoring, one per trade
+            
+        Returns:
+            Scores from 0-100, in trade order
+        """
+        n = len(trades)
+        if n == 0:
+            return []
+        
+        prob_profit = np.fromiter(
+            (self._probability_of_profit(p) for p in probability_metrics),
+            dtype=np.float64,
+            count=n
+        )
+        rr_ratio = np.fromiter(
+            (r.get('risk_reward_ratio', 0) for r in risk_metrics),
+            dtype=np.float64,
+            count=n
+        )
+        
+        # Component scores
+        prob_scores = prob_profit * 100
+        rr_scores = np.minimum(rr_ratio / 3.0, 1.0) * 100
+        iv_scores = np.fromiter(
+            (self._score_iv_edge(t, o) for t, o in zip(trades, options_data)),
+            dtype=np.float64,
+            count=n
+        )
+        liquidity_scores = self._score_liquidity_batch(trades, options_data)
+        trend_scores = np.fromiter(
+            (self._score_trend_alignment(t) for t in trades),
+            dtype=np.float64,
+            count=n
+        )
+        
+        # Weighted composite score
+        scores_matrix = np.column_stack(
+            (prob_scores, rr_scores, iv_scores, liquidity_scores, trend_scores)
+        )
+        total_scores = scores_matrix @ self._weights
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, trade in enumerate(trades):
+                logger.debug(f"{trade.symbol}: P={prob_scores[i]:.1f} RR={rr_scores[i]:.1f} "
+                            f"IV={iv_scores[i]:.1f} L={liquidity_scores[i]:.1f} T={trend_scores[i]:.1f} "
+                            f"→ Total={total_scores[i]:.1f}")
+        
+        return [round(score, 1) for score in total_scores.tolist()]
+    
     def _score_probability(self, prob_metrics: Dict[str, Any]) -> float:
         """
         Score based on probability of profit (0-100).
@@ -69,15 +202,16 @@ class TradeScorer:
         Returns:
             Score 0-100
         """
-        # Use Monte Carlo probability if available, otherwise ITM probability
+        # Convert to 0-100 scale
+        return self._probability_of_profit(prob_metrics) * 100
+    
+    @staticmethod
+    def _probability_of_profit(prob_metrics: Dict[str, Any]) -> float:
+        """Monte Carlo probability of profit if available, otherwise ITM probability."""
         mc_results = prob_metrics.get('monte_carlo', {})
         if mc_results:
-            prob_profit = mc_results.get('probability_profit', 0)
-        else:
-            prob_profit = prob_metrics.get('probability_itm', 0)
-        
-        # Convert to 0-100 scale
-        return prob_profit * 100
+            return mc_results.get('probability_profit', 0)
+        return prob_metrics.get('probability_itm', 0)
     
     def _score_risk_reward(self, risk_metrics: Dict[str, Any]) -> float:
         """
@@ -97,7 +231,7 @@ class TradeScorer:
         
         return normalized_rr * 100
     
-    def _score_iv_edge(self, trade: Dict[str, Any], options_data: Dict[str, Any]) -> float:
+    def _score_iv_edge(self, trade: Trade, options_data: Dict[str, Any]) -> float:
         """
         Score based on IV percentile advantage (0-100).
         
@@ -109,32 +243,22 @@ class TradeScorer:
             Score 0-100
         """
         # Get IV from first leg
-        legs = trade.get('legs', [])
+        legs = trade.legs
         if not legs:
             return 50.0
         
         # Estimate IV percentile (simplified)
         # In production, you'd compare current IV to historical range
-        strategy = trade.get('strategy', '')
-        condition = trade.get('condition', '')
-        
         # Favor low IV for debit strategies, high IV for credit strategies
-        if 'Debit' in strategy or 'Long' in strategy:
-            # Want low IV
-            if 'breakout' in condition:
-                return 80.0  # Low IV is good
-            else:
-                return 60.0
-        elif 'Credit' in strategy or 'Condor' in strategy:
-            # Want high IV
-            if 'high_iv' in condition or 'choppy' in condition:
-                return 80.0  # High IV is good
-            else:
-                return 60.0
-        else:
-            return 50.0
+        kind = _strategy_kind(trade.strategy)
+        cond_kind = _condition_kind(trade.condition)
+        
+        score = _IV_EDGE_TABLE.get((kind, cond_kind))
+        if score is None:
+            score = _IV_EDGE_TABLE.get((kind, '*'), 50.0)
+        return score
     
-    def _score_liquidity(self, trade: Dict[str, Any], options_data: Dict[str, Any]) -> float:
+    def _score_liquidity(self, trade: Trade, options_data: Dict[str, Any]) -> float:
         """
         Score based on options liquidity (0-100).
         
@@ -145,62 +269,200 @@ class TradeScorer:
         Returns:
             Score 0-100
         """
-        legs = trade.get('legs', [])
+        legs = trade.legs
         if not legs:
             return 0
         
-        # Get all contracts used in trade
-        all_contracts = []
-        if trade.get('bias') in ['bullish', 'neutral']:
-            all_contracts.extend(options_data.get('calls', []))
-        if trade.get('bias') in ['bearish', 'neutral']:
-            all_contracts.extend(options_data.get('puts', []))
-        
-        if not all_contracts:
+        legs_key = self._liquidity_legs_key(trade, options_data)
+        if legs_key is None:
             return 50.0
         
-        # Find contracts matching trade legs
+        # Many structures share legs; memoize per options_data like the index
+        memo = options_data.setdefault('_liquidity_memo', {})
+        score = memo.get(legs_key)
+        if score is None:
+            score = self._liquidity_from_index(self._build_contract_index(options_data), legs_key)
+            memo[legs_key] = score
+        return score
+    
+    @staticmethod
+    def _liquidity_legs_key(
+        trade: Trade,
+        options_data: Dict[str, Any]
+    ) -> Optional[Tuple[Tuple[float, str], ...]]:
+        """
+        (strike, option_type) of each leg whose type the trade's bias allows.
+        
+        Args:
+            trade: Trade structure
+            options_data: Options data
+            
+        Returns:
+            Tuple of leg keys, or None if no contracts exist for the bias
+        """
+        # Contract types available for this trade's bias
+        bias = trade.bias
+        option_types = []
+        if bias in ['bullish', 'neutral'] and options_data.get('calls'):
+            option_types.append('CALL')
+        if bias in ['bearish', 'neutral'] and options_data.get('puts'):
+            option_types.append('PUT')
+        
+        if not option_types:
+            return None
+        
+        return tuple(
+            (leg.strike, leg.option_type)
+            for leg in trade.legs
+            if leg.option_type in option_types
+        )
+    
+    def _score_liquidity_batch(
+        self,
+        trades: List[Trade],
+        options_data: List[Dict[str, Any]]
+    ) -> np.ndarray:
+        """
+        Liquidity scores for many trades in one vectorized pass.
+        
+        Matched contracts of every leg across all trades go into one table.
+        Leg scores are computed with NumPy and averaged back per trade with
+        np.bincount. Results match _score_liquidity.
+        
+        Args:
+            trades: Trade structures
+            options_data: Options data, one per trade
+            
+        Returns:
+            Scores 0-100, in trade order
+        """
+        n = len(trades)
+        scores = np.full(n, 50.0)
+        
+        contracts = []
+        trade_ids = []
+        for i, (trade, data) in enumerate(zip(trades, options_data)):
+            if not trade.legs:
+                scores[i] = 0
+                continue
+            
+            legs_key = self._liquidity_legs_key(trade, data)
+            if not legs_key:
+                continue
+            
+            index = self._build_contract_index(data)
+            for leg_key in legs_key:
+                contract = index.get(leg_key)
+                if contract:
+                    contracts.append(contract)
+                    trade_ids.append(i)
+        
+        if not contracts:
+            return scores
+        
+        leg_table = np.array(
+            [
+                [c.get('openInterest', 0), c.get('totalVolume', 0), c.get('bid', 0), c.get('ask', 0)]
+                for c in contracts
+            ],
+            dtype=np.float64
+        )
+        oi, volume, bid, ask = leg_table.T
+        
+        # OI score (>5000 = 100, linear from 1000-5000)
+        oi_scores = np.clip((oi - 1000) / 4000 * 100, 0, 100)
+        
+        # Volume score (>1000 = 100, linear from 300-1000)
+        vol_scores = np.clip((volume - 300) / 700 * 100, 0, 100)
+        
+        # Spread score (tighter = better); 5% spread = 0 points
+        quoted = (bid > 0) & (ask > 0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            spread_pct = ((ask - bid) / ((ask + bid) / 2)) * 100
+        spread_scores = np.where(quoted, np.maximum(100 - spread_pct * 20, 0), 0)
+        
+        leg_scores = oi_scores * 0.4 + vol_scores * 0.4 + spread_scores * 0.2
+        
+        # Average leg scores per trade
+        ids = np.array(trade_ids)
+        sums = np.bincount(ids, weights=leg_scores, minlength=n)
+        counts = np.bincount(ids, minlength=n)
+        has_legs = counts > 0
+        scores[has_legs] = sums[has_legs] / counts[has_legs]
+        
+        return scores
+    
+    @staticmethod
+    def _liquidity_from_index(
+        index: Dict[Tuple[float, str], Dict[str, Any]],
+        legs_key: Tuple[Tuple[float, str], ...]
+    ) -> float:
+        """
+        Average liquidity score (0-100) of the contracts behind a set of legs.
+        
+        Args:
+            index: Contract index from _build_contract_index
+            legs_key: (strike, option_type) per leg
+            
+        Returns:
+            Score 0-100, or 50 if no leg matches a contract
+        """
         leg_scores = []
-        for leg in legs:
-            strike = leg.get('strike')
-            option_type = leg.get('option_type')
+        for leg_key in legs_key:
+            contract = index.get(leg_key)
+            if not contract:
+                continue
+            
+            # Score based on OI, volume, and spread
+            oi = contract.get('openInterest', 0)
+            volume = contract.get('totalVolume', 0)
+            bid = contract.get('bid', 0)
+            ask = contract.get('ask', 0)
             
-            # Find matching contract
-            matching = [
-                c for c in all_contracts
-                if c.get('strikePrice') == strike and c.get('option_type') == option_type
-            ]
+            # OI score (>5000 = 100, linear from 1000-5000)
+            oi_score = min((oi - 1000) / 4000 * 100, 100) if oi >= 1000 else 0
+            
+            # Volume score (>1000 = 100, linear from 300-1000)
+            vol_score = min((volume - 300) / 700 * 100, 100) if volume >= 300 else 0
+            
+            # Spread score (tighter = better)
+            if bid > 0 and ask > 0:
+                spread_pct = ((ask - bid) / ((ask + bid) / 2)) * 100
+                spread_score = max(100 - spread_pct * 20, 0)  # 5% spread = 0 points
+            else:
+                spread_score = 0
             
-            if matching:
-                contract = matching[0]
-                
-                # Score based on OI, volume, and spread
-                oi = contract.get('openInterest', 0)
-                volume = contract.get('totalVolume', 0)
-                bid = contract.get('bid', 0)
-                ask = contract.get('ask', 0)
-                
-                # OI score (>5000 = 100, linear from 1000-5000)
-                oi_score = min((oi - 1000) / 4000 * 100, 100) if oi >= 1000 else 0
-                
-                # Volume score (>1000 = 100, linear from 300-1000)
-                vol_score = min((volume - 300) / 700 * 100, 100) if volume >= 300 else 0
-                
-                # Spread score (tighter = better)
-                if bid > 0 and ask > 0:
-                    spread_pct = ((ask - bid) / ((ask + bid) / 2)) * 100
-                    spread_score = max(100 - spread_pct * 20, 0)  # 5% spread = 0 points
-                else:
-                    spread_score = 0
-                
-                # Composite liquidity score for this leg
-                leg_score = (oi_score * 0.4 + vol_score * 0.4 + spread_score * 0.2)
-                leg_scores.append(leg_score)
+            # Composite liquidity score for this leg
+            leg_score = (oi_score * 0.4 + vol_score * 0.4 + spread_score * 0.2)
+            leg_scores.append(leg_score)
         
         # Average across all legs
         return sum(leg_scores) / len(leg_scores) if leg_scores else 50.0
     
-    def _score_trend_alignment(self, trade: Dict[str, Any]) -> float:
+    @staticmethod
+    def _build_contract_index(options_data: Dict[str, Any]) -> Dict[Tuple[float, str], Dict[str, Any]]:
+        """
+        Map (strike, option type) to contract, built once per options_data.
+        
+        The index is stored on options_data under '_index' so every trade
+        scored against the same chain reuses it. When several expirations
+        share a strike, the first contract in list order wins.
+        
+        Args:
+            options_data: Filtered options data with calls and puts
+            
+        Returns:
+            Dictionary of (strikePrice, option_type) to contract
+        """
+        index = options_data.get('_index')
+        if index is None:
+            index = {}
+            for contract in chain(options_data.get('calls', []), options_data.get('puts', [])):
+                index.setdefault((contract.get('strikePrice'), contract.get('option_type')), contract)
+            options_data['_index'] = index
+        return index
+    
+    def _score_trend_alignment(self, trade: Trade) -> float:
         """
         Score based on trend alignment with strategy (0-100).
         
@@ -210,49 +472,48 @@ class TradeScorer:
         Returns:
             Score 0-100
         """
-        bias = trade.get('bias', 'neutral')
-        condition = trade.get('condition', '')
-        
-        # Strong alignment gets high score
-        if 'strong' in condition:
-            return 90.0
-        elif 'breakout' in condition:
-            return 80.0
-        elif 'high_iv' in condition:
-            return 70.0
-        elif 'choppy' in condition:
-            # Neutral strategies in choppy markets
-            if bias == 'neutral':
-                return 75.0
-            else:
-                return 50.0
-        else:
-            return 60.0
+        bias = trade.bias
+        cond_kind = _condition_kind(trade.condition)
+        
+        # Strong alignment gets high score; neutral strategies suit choppy markets
+        score = _TREND_TABLE.get((cond_kind, bias))
+        if score is None:
+            score = _TREND_TABLE.get((cond_kind, '*'), 60.0)
+        return score
     
     def rank_trades(
         self,
-        scored_trades: List[Dict[str, Any]]
-    ) -> List[Dict[str, Any]]:
+        scored_trades: List[ScoredTrade]
+    ) -> List[ScoredTrade]:
         """
         Rank trades by score and filter by minimum threshold.
         
         Args:
-            scored_trades: List of trades with scores
+            scored_trades: Trades with their scores
             
         Returns:
             Filtered and sorted list of top trades
         """
+        min_score, max_trades = self.settings.min_trade_score, self.settings.max_trades_output
+        scores = np.fromiter(
+            (t.score for t in scored_trades),
+            dtype=np.float64,
+            count=len(scored_trades)
+        )
+        
         # Filter by minimum score
-        filtered = [
-            t for t in scored_trades
-            if t.get('score', 0) >= self.settings.min_trade_score
-        ]
+        idx = np.flatnonzero(scores >= min_score)
+        
+        # Narrow to the top N in O(n), keeping every trade tied with the Nth score
+        if len(idx) > max_trades > 0:
+            kth = np.partition(scores[idx], len(idx) - max_trades)[len(idx) - max_trades]
+            idx = idx[scores[idx] >= kth]
         
-        # Sort by score descending
-        ranked = sorted(filtered, key=lambda x: x.get('score', 0), reverse=True)
+        # Sort by score descending; stable so ties keep input order
+        idx = idx[np.argsort(-scores[idx], kind='stable')]
         
         # Return top N trades
-        top_trades = ranked[:self.settings.max_trades_output]
+        top_trades = [scored_trades[i] for i in idx[:max(max_trades, 0)]]
         
         logger.info(f"✓ Ranked {len(scored_trades)} trades → {len(top_trades)} above threshold")
         
@@ -1,12 +1,14 @@
 """Strategies package initialization."""
 
-from .strategy_configs import StrategyType, MarketCondition, StrategyConfig, get_strategy_config
+from .strategy_configs import StrategyType, MarketCondition, StrategyConfig, Leg, Trade, get_strategy_config
 from .strategy_selector import StrategySelector
 
 __all__ = [
     'StrategyType',
     'MarketCondition',
     'StrategyConfig',
+    'Leg',
+    'Trade',
     'get_strategy_config',
     'StrategySelector'
 ]
@@ -0,0 +1,41 @@
+"""Compiled argmin kernel for strategy contract selection.
+
+With Numba installed the kernel is compiled once, cached on disk
+(cache=True) and warmed at import. Without Numba it falls back to the
+equivalent NumPy argmin. Both branches follow np.argmin: ties go to the
+earliest index and the first NaN distance wins.
+"""
+
+import numpy as np
+
+from src.analytics._njit import njit, NUMBA_AVAILABLE
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def argmin_abs_delta(delta_arr, target):
+        """Index of the first contract whose |delta| is closest to target."""
+        if delta_arr.shape[0] == 0:
+            raise ValueError("attempt to get argmin of an empty sequence")
+        best = abs(abs(delta_arr[0]) - target)
+        if np.isnan(best):
+            return 0
+        k = 0
+        for i in range(1, delta_arr.shape[0]):
+            d = abs(abs(delta_arr[i]) - target)
+            if np.isnan(d):
+                return i
+            if d < best:
+                best = d
+                k = i
+        return k
+
+    # Compile (or load from cache) now rather than on the first trade
+    _warmup = np.zeros(1, dtype=np.float64)
+    argmin_abs_delta(_warmup, 0.5)
+    del _warmup
+else:
+    def argmin_abs_delta(delta_arr, target):
+        """Index of the first contract whose |delta| is closest to target."""
+        return int(np.argmin(np.abs(np.abs(delta_arr) - target)))
+
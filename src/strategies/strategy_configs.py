@@ -1,7 +1,7 @@
 """Strategy configuration parameters."""
 
 from enum import Enum
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
 
@@ -28,7 +28,7 @@ class MarketCondition(Enum):
     NEWS_SPIKE = "news_spike"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StrategyConfig:
     """Configuration for a specific strategy."""
     strategy_type: StrategyType
@@ -38,6 +38,64 @@ class StrategyConfig:
     description: str
 
 
+@dataclass(frozen=True, slots=True)
+class Leg:
+    """Single option leg of a selected trade."""
+    action: str  # 'BUY' or 'SELL'
+    option_type: str  # 'CALL' or 'PUT'
+    strike: float
+    quantity: int
+    price: float  # Mid price per share
+    delta: Optional[float] = None
+    theta: Optional[float] = None
+    vega: Optional[float] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the leg dictionary written to outputs (unset Greeks omitted)."""
+        leg = {
+            'action': self.action,
+            'option_type': self.option_type,
+            'strike': self.strike,
+            'quantity': self.quantity,
+            'price': self.price
+        }
+        if self.delta is not None:
+            leg['delta'] = self.delta
+        if self.theta is not None:
+            leg['theta'] = self.theta
+        if self.vega is not None:
+            leg['vega'] = self.vega
+        return leg
+
+
+@dataclass(frozen=True, slots=True)
+class Trade:
+    """Trade structure produced by the strategy selector."""
+    symbol: str
+    strategy: str
+    condition: str
+    bias: str
+    underlying_price: float
+    expiration: Any
+    dte: Optional[int]
+    legs: Tuple[Leg, ...]
+    explanation: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the trade dictionary written to outputs."""
+        return {
+            'symbol': self.symbol,
+            'strategy': self.strategy,
+            'condition': self.condition,
+            'bias': self.bias,
+            'underlying_price': self.underlying_price,
+            'expiration': self.expiration,
+            'dte': self.dte,
+            'legs': [leg.to_dict() for leg in self.legs],
+            'explanation': self.explanation
+        }
+
+
 # Strategy configurations mapped to market conditions
 STRATEGY_CONFIGS: Dict[MarketCondition, StrategyConfig] = {
     MarketCondition.STRONG_BULLISH: StrategyConfig(
@@ -97,6 +155,11 @@ STRATEGY_CONFIGS: Dict[MarketCondition, StrategyConfig] = {
     ),
 }
 
+# Attach each config to its condition so lookup is a plain attribute read
+for _condition, _config in STRATEGY_CONFIGS.items():
+    _condition._config = _config
+del _condition, _config
+
 
 def get_strategy_config(condition: MarketCondition) -> StrategyConfig:
     """
@@ -108,4 +171,4 @@ def get_strategy_config(condition: MarketCondition) -> StrategyConfig:
     Returns:
         Strategy configuration
     """
-    return STRATEGY_CONFIGS.get(condition)
+    return getattr(condition, '_config', None)
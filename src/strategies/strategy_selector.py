@@ -5,16 +5,52 @@ from typing import Dict, Any, Optional, List, Tuple
 
 from config.settings import get_settings
 from src.utils.logger import get_logger
+from . import _kernels as kernels
 from .strategy_configs import (
     StrategyType,
     MarketCondition,
     StrategyConfig,
+    Leg,
+    Trade,
     get_strategy_config
 )
 
 
 logger = get_logger(__name__)
 
+# ATM IV (%) bucket edges and the percentile estimate for each bucket:
+# <20 -> 20, <30 -> 35, <40 -> 50, <60 -> 70, otherwise 85
+_IV_BUCKETS = np.array([20.0, 30.0, 40.0, 60.0])
+_IV_VALUES = np.array([20.0, 35.0, 50.0, 70.0, 85.0])
+
+# Condition and strategy groups used for membership tests
+_BULLISH = frozenset({MarketCondition.STRONG_BULLISH, MarketCondition.BULLISH_BREAKOUT})
+_BEARISH = frozenset({MarketCondition.STRONG_BEARISH, MarketCondition.BEARISH_BREAKOUT})
+_CALL_STRATS = frozenset({
+    StrategyType.LONG_CALL,
+    StrategyType.CALL_DEBIT_SPREAD,
+    StrategyType.CALL_CREDIT_SPREAD
+})
+_PUT_STRATS = frozenset({
+    StrategyType.LONG_PUT,
+    StrategyType.PUT_DEBIT_SPREAD,
+    StrategyType.PUT_CREDIT_SPREAD
+})
+_DEBIT_SPREADS = frozenset({StrategyType.CALL_DEBIT_SPREAD, StrategyType.PUT_DEBIT_SPREAD})
+
+# Directional conditions by VWAP bias
+_STRONG_BY_BIAS = {
+    'bullish': MarketCondition.STRONG_BULLISH,
+    'bearish': MarketCondition.STRONG_BEARISH
+}
+_BREAKOUT_BY_BIAS = {
+    'bullish': MarketCondition.BULLISH_BREAKOUT,
+    'bearish': MarketCondition.BEARISH_BREAKOUT
+}
+
+# Spreads whose short strike sits above the long strike
+_SHORT_ABOVE_STRATS = frozenset({StrategyType.CALL_DEBIT_SPREAD, StrategyType.PUT_CREDIT_SPREAD})
+
 
 class StrategySelector:
     """Select optimal options strategy based on market conditions."""
@@ -22,12 +58,17 @@ class StrategySelector:
     def __init__(self):
         """Initialize strategy selector."""
         self.settings = get_settings()
+        
+        # IV thresholds, read once for _detect_market_condition
+        self._extreme_iv = float(self.settings.extreme_iv_threshold)
+        self._low_iv = float(self.settings.low_iv_threshold)
+        self._high_iv = float(self.settings.high_iv_threshold)
     
     def select_strategy(
         self,
         candidate: Dict[str, Any],
         options_data: Dict[str, Any]
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[Trade]:
         """
         Analyze market conditions and select optimal strategy.
         
@@ -36,7 +77,7 @@ class StrategySelector:
             options_data: Filtered options data
             
         Returns:
-            Strategy selection with details, or None if should skip
+            Selected Trade (see Trade.to_dict), or None if should skip
         """
         symbol = candidate['symbol']
         logger.info(f"🎯 Selecting strategy for {symbol}...")
@@ -95,38 +136,30 @@ class StrategySelector:
         volume_ratio = volume / avg_volume if avg_volume > 0 else 1
         
         # Check for news/extreme IV spike
-        if iv_percentile > self.settings.extreme_iv_threshold:
+        if iv_percentile > self._extreme_iv:
             return MarketCondition.NEWS_SPIKE
         
         # Strong momentum conditions
-        if volume_ratio > 2.0 and atr > 2.5:
-            if vwap_bias == 'bullish':
-                return MarketCondition.STRONG_BULLISH
-            elif vwap_bias == 'bearish':
-                return MarketCondition.STRONG_BEARISH
+        strong = _STRONG_BY_BIAS.get(vwap_bias)
+        if strong is not None and volume_ratio > 2.0 and atr > 2.5:
+            return strong
         
         # Breakout conditions (high volume, low IV)
-        if volume_ratio > 1.5 and iv_percentile < self.settings.low_iv_threshold:
-            if vwap_bias == 'bullish':
-                return MarketCondition.BULLISH_BREAKOUT
-            elif vwap_bias == 'bearish':
-                return MarketCondition.BEARISH_BREAKOUT
-        
-        # High IV range-bound
-        if iv_percentile > self.settings.high_iv_threshold and vwap_bias == 'neutral':
-            return MarketCondition.HIGH_IV_RANGE
-        
-        # Choppy market (neutral bias, low volume)
-        if vwap_bias == 'neutral' and volume_ratio < 1.5:
-            return MarketCondition.CHOPPY
+        breakout = _BREAKOUT_BY_BIAS.get(vwap_bias)
+        if breakout is not None and volume_ratio > 1.5 and iv_percentile < self._low_iv:
+            return breakout
+        
+        if vwap_bias == 'neutral':
+            # High IV range-bound
+            if iv_percentile > self._high_iv:
+                return MarketCondition.HIGH_IV_RANGE
+            
+            # Choppy market (neutral bias, low volume)
+            if volume_ratio < 1.5:
+                return MarketCondition.CHOPPY
         
         # Default to appropriate directional strategy
-        if vwap_bias == 'bullish':
-            return MarketCondition.BULLISH_BREAKOUT
-        elif vwap_bias == 'bearish':
-            return MarketCondition.BEARISH_BREAKOUT
-        else:
-            return MarketCondition.CHOPPY
+        return breakout if breakout is not None else MarketCondition.CHOPPY
     
     def _estimate_iv_percentile(self, options_data: Dict[str, Any]) -> float:
         """
@@ -138,6 +171,11 @@ class StrategySelector:
         Returns:
             Estimated IV percentile (0-100)
         """
+        # Computed once per payload; every candidate on the chain reuses it
+        iv_pct = options_data.get('_iv_pct')
+        if iv_pct is not None:
+            return iv_pct
+        
         # Get ATM call IV as proxy
         calls = options_data.get('calls', [])
         
@@ -145,25 +183,142 @@ class StrategySelector:
             return 50.0  # Default to middle
         
         # Find ATM option (delta closest to 0.5)
-        atm_call = min(
-            calls,
-            key=lambda x: abs(abs(x.get('greeks', {}).get('delta', 0)) - 0.5)
-        )
+        soa = self._contracts_soa(options_data, 'calls')
+        atm_call = calls[kernels.argmin_abs_delta(soa['delta'], 0.5)]
         
         iv = atm_call.get('volatility', 0) * 100  # Convert to percentage
         
         # Simplified percentile estimation
         # In production, you'd compare to historical IV range
-        if iv < 20:
-            return 20.0
-        elif iv < 30:
-            return 35.0
-        elif iv < 40:
-            return 50.0
-        elif iv < 60:
-            return 70.0
-        else:
-            return 85.0
+        iv_pct = float(_IV_VALUES[int(np.searchsorted(_IV_BUCKETS, iv, side='right'))])
+        options_data['_iv_pct'] = iv_pct
+        return iv_pct
+    
+    @staticmethod
+    def _contracts_soa(options_data: Dict[str, Any], side: str) -> Dict[str, np.ndarray]:
+        """
+        Column arrays for options_data['calls'] or ['puts'].
+        
+        Args:
+            options_data: Filtered options data from OptionsFilter
+            side: 'calls' or 'puts'
+            
+        Returns:
+            The filter's row-aligned '<side>_soa' arrays (SOA_FIELDS plus 'mid')
+        """
+        return options_data[f'{side}_soa']
+    
+    def _dte_window(
+        self,
+        options_data: Dict[str, Any],
+        side: str,
+        max_dte: int
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, np.ndarray]]:
+        """
+        Contracts on one side expiring within max_dte, with matching arrays.
+        
+        Windows are cached on options_data per (side, max_dte). Besides the
+        _contracts_soa arrays, each window holds its |delta| values sorted
+        ('abs_delta_sorted') and the stable sort order ('abs_delta_order')
+        for _nearest_abs_delta, and likewise 'strike_sorted' and
+        'strike_order' for _nearest_strike.
+        
+        Args:
+            options_data: Options data
+            side: 'calls' or 'puts'
+            max_dte: Maximum days to expiration
+            
+        Returns:
+            Tuple of (contracts, arrays row-aligned with those contracts)
+        """
+        windows = options_data.setdefault('_dte_windows', {})
+        window = windows.get((side, max_dte))
+        if window is None:
+            contracts = options_data.get(side, [])
+            soa = self._contracts_soa(options_data, side)
+            idx = np.flatnonzero(soa['dte'] <= max_dte)
+            
+            window_soa = {name: arr[idx] for name, arr in soa.items()}
+            abs_delta = np.abs(window_soa['delta'])
+            order = np.argsort(abs_delta, kind='stable')
+            window_soa['abs_delta_order'] = order
+            window_soa['abs_delta_sorted'] = abs_delta[order]
+            order = np.argsort(window_soa['strike'], kind='stable')
+            window_soa['strike_order'] = order
+            window_soa['strike_sorted'] = window_soa['strike'][order]
+            
+            window = ([contracts[i] for i in idx], window_soa)
+            windows[(side, max_dte)] = window
+        return window
+    
+    @staticmethod
+    def _nearest_abs_delta(soa: Dict[str, np.ndarray], target: float) -> int:
+        """
+        Row whose |delta| is closest to target, by binary search.
+        
+        Same result as kernels.argmin_abs_delta: on ties the earliest row
+        wins.
+        
+        Args:
+            soa: Window arrays from _dte_window (must be non-empty)
+            target: Target |delta|
+            
+        Returns:
+            Row index into the window
+        """
+        return StrategySelector._nearest_sorted(soa['abs_delta_sorted'], soa['abs_delta_order'], target)
+    
+    @staticmethod
+    def _nearest_strike(soa: Dict[str, np.ndarray], target: float) -> int:
+        """
+        Row whose strike is closest to target, by binary search.
+        
+        Same result as np.argmin(np.abs(strike - target)): on ties the
+        earliest row wins.
+        
+        Args:
+            soa: Window arrays from _dte_window (must be non-empty)
+            target: Target strike
+            
+        Returns:
+            Row index into the window
+        """
+        return StrategySelector._nearest_sorted(soa['strike_sorted'], soa['strike_order'], target)
+    
+    @staticmethod
+    def _nearest_sorted(values: np.ndarray, order: np.ndarray, target: float) -> int:
+        """
+        Original row of the sorted value closest to target.
+        
+        Args:
+            values: Values sorted ascending
+            order: Stable argsort that produced values
+            target: Target value
+            
+        Returns:
+            Lowest original row among those nearest to target
+        """
+        i = int(np.searchsorted(values, target, side='left'))
+        
+        if i == len(values):
+            # All below target; first row holding the largest value
+            return int(order[np.searchsorted(values, values[-1], side='left')])
+        
+        upper = int(order[i])
+        if i == 0:
+            return upper
+        
+        # First row holding the nearest value below target
+        j = int(np.searchsorted(values, values[i - 1], side='left'))
+        lower = int(order[j])
+        
+        lower_dist = abs(values[i - 1] - target)
+        upper_dist = abs(values[i] - target)
+        if lower_dist < upper_dist:
+            return lower
+        if upper_dist < lower_dist:
+            return upper
+        return min(lower, upper)
     
     def _build_trade_structure(
         self,
@@ -171,7 +326,7 @@ class StrategySelector:
         options_data: Dict[str, Any],
         condition: MarketCondition,
         config: StrategyConfig
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[Trade]:
         """
         Build complete trade structure with strikes and contracts.
         
@@ -182,28 +337,21 @@ class StrategySelector:
             config: Strategy configuration
             
         Returns:
-            Trade structure dictionary
+            Trade structure (convert with to_dict() before enriching)
         """
         symbol = candidate['symbol']
         underlying_price = options_data['underlying_price']
         
         # Determine if bullish or bearish
-        is_bullish = condition in [
-            MarketCondition.STRONG_BULLISH,
-            MarketCondition.BULLISH_BREAKOUT
-        ]
-        
-        is_bearish = condition in [
-            MarketCondition.STRONG_BEARISH,
-            MarketCondition.BEARISH_BREAKOUT
-        ]
+        is_bullish = condition in _BULLISH
+        is_bearish = condition in _BEARISH
         
         # Select appropriate contracts
-        if config.strategy_type in [StrategyType.LONG_CALL, StrategyType.CALL_DEBIT_SPREAD, StrategyType.CALL_CREDIT_SPREAD]:
-            contracts = options_data.get('calls', [])
+        if config.strategy_type in _CALL_STRATS:
+            side = 'calls'
             option_type = 'CALL'
-        elif config.strategy_type in [StrategyType.LONG_PUT, StrategyType.PUT_DEBIT_SPREAD, StrategyType.PUT_CREDIT_SPREAD]:
-            contracts = options_data.get('puts', [])
+        elif config.strategy_type in _PUT_STRATS:
+            side = 'puts'
             option_type = 'PUT'
         elif config.strategy_type == StrategyType.IRON_CONDOR:
             # Iron condor uses both
@@ -212,49 +360,49 @@ class StrategySelector:
             return None
         
         # Filter by DTE
-        contracts = [c for c in contracts if c.get('dte', 999) <= config.max_dte]
+        contracts, soa = self._dte_window(options_data, side, config.max_dte)
         
         if not contracts:
             return None
         
         # Find contract closest to target delta
-        long_contract = min(
-            contracts,
-            key=lambda x: abs(abs(x.get('greeks', {}).get('delta', 0)) - config.delta_target)
-        )
+        long_idx = self._nearest_abs_delta(soa, config.delta_target)
+        long_contract = contracts[long_idx]
         
         # Build trade based on strategy type
         if config.spread_width == 0:
             # Single option
-            return {
-                'symbol': symbol,
-                'strategy': config.strategy_type.value,
-                'condition': condition.value,
-                'bias': 'bullish' if is_bullish else 'bearish' if is_bearish else 'neutral',
-                'underlying_price': underlying_price,
-                'expiration': long_contract.get('expiration'),
-                'dte': long_contract.get('dte'),
-                'legs': [
-                    {
-                        'action': 'BUY',
-                        'option_type': option_type,
-                        'strike': long_contract.get('strikePrice'),
-                        'quantity': 1,
-                        'price': (long_contract.get('bid', 0) + long_contract.get('ask', 0)) / 2,
-                        'delta': long_contract.get('greeks', {}).get('delta'),
-                        'theta': long_contract.get('greeks', {}).get('theta'),
-                        'vega': long_contract.get('greeks', {}).get('vega'),
-                    }
-                ],
-                'explanation': config.description
-            }
+            greeks = long_contract.get('greeks', {})
+            return Trade(
+                symbol=symbol,
+                strategy=config.strategy_type.value,
+                condition=condition.value,
+                bias='bullish' if is_bullish else 'bearish' if is_bearish else 'neutral',
+                underlying_price=underlying_price,
+                expiration=long_contract.get('expiration'),
+                dte=long_contract.get('dte'),
+                legs=(
+                    Leg(
+                        action='BUY',
+                        option_type=option_type,
+                        strike=long_contract.get('strikePrice'),
+                        quantity=1,
+                        price=float(soa['mid'][long_idx]),
+                        delta=greeks.get('delta'),
+                        theta=greeks.get('theta'),
+                        vega=greeks.get('vega'),
+                    ),
+                ),
+                explanation=config.description
+            )
         else:
             # Spread
             return self._build_spread(
                 symbol,
                 underlying_price,
-                long_contract,
+                long_idx,
                 contracts,
+                soa,
                 config,
                 condition,
                 is_bullish,
@@ -266,19 +414,21 @@ class StrategySelector:
         self,
         symbol: str,
         underlying_price: float,
-        long_contract: Dict[str, Any],
+        long_idx: int,
         contracts: List[Dict[str, Any]],
+        soa: Dict[str, np.ndarray],
         config: StrategyConfig,
         condition: MarketCondition,
         is_bullish: bool,
         is_bearish: bool,
         option_type: str
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[Trade]:
         """Build vertical spread trade structure."""
+        long_contract = contracts[long_idx]
         long_strike = long_contract.get('strikePrice')
         
         # Find short strike (spread_width away)
-        if config.strategy_type in [StrategyType.CALL_DEBIT_SPREAD, StrategyType.PUT_CREDIT_SPREAD]:
+        if config.strategy_type in _SHORT_ABOVE_STRATS:
             # For call debit or put credit, short strike is higher
             target_short_strike = long_strike + config.spread_width
         else:
@@ -286,100 +436,94 @@ class StrategySelector:
             target_short_strike = long_strike - config.spread_width
         
         # Find contract closest to target short strike
-        short_contract = min(
-            contracts,
-            key=lambda x: abs(x.get('strikePrice', 0) - target_short_strike)
-        )
+        short_idx = self._nearest_strike(soa, target_short_strike)
+        short_contract = contracts[short_idx]
         
         # Determine if debit or credit spread
-        is_debit = config.strategy_type in [StrategyType.CALL_DEBIT_SPREAD, StrategyType.PUT_DEBIT_SPREAD]
-        
-        return {
-            'symbol': symbol,
-            'strategy': config.strategy_type.value,
-            'condition': condition.value,
-            'bias': 'bullish' if is_bullish else 'bearish' if is_bearish else 'neutral',
-            'underlying_price': underlying_price,
-            'expiration': long_contract.get('expiration'),
-            'dte': long_contract.get('dte'),
-            'legs': [
-                {
-                    'action': 'BUY' if is_debit else 'SELL',
-                    'option_type': option_type,
-                    'strike': long_strike,
-                    'quantity': 1,
-                    'price': (long_contract.get('bid', 0) + long_contract.get('ask', 0)) / 2,
-                    'delta': long_contract.get('greeks', {}).get('delta'),
-                    'theta': long_contract.get('greeks', {}).get('theta'),
-                },
-                {
-                    'action': 'SELL' if is_debit else 'BUY',
-                    'option_type': option_type,
-                    'strike': short_contract.get('strikePrice'),
-                    'quantity': 1,
-                    'price': (short_contract.get('bid', 0) + short_contract.get('ask', 0)) / 2,
-                    'delta': short_contract.get('greeks', {}).get('delta'),
-                    'theta': short_contract.get('greeks', {}).get('theta'),
-                }
-            ],
-            'explanation': config.description
-        }
+        is_debit = config.strategy_type in _DEBIT_SPREADS
+        long_greeks = long_contract.get('greeks', {})
+        short_greeks = short_contract.get('greeks', {})
+        
+        return Trade(
+            symbol=symbol,
+            strategy=config.strategy_type.value,
+            condition=condition.value,
+            bias='bullish' if is_bullish else 'bearish' if is_bearish else 'neutral',
+            underlying_price=underlying_price,
+            expiration=long_contract.get('expiration'),
+            dte=long_contract.get('dte'),
+            legs=(
+                Leg(
+                    action='BUY' if is_debit else 'SELL',
+                    option_type=option_type,
+                    strike=long_strike,
+                    quantity=1,
+                    price=float(soa['mid'][long_idx]),
+                    delta=long_greeks.get('delta'),
+                    theta=long_greeks.get('theta'),
+                ),
+                Leg(
+                    action='SELL' if is_debit else 'BUY',
+                    option_type=option_type,
+                    strike=short_contract.get('strikePrice'),
+                    quantity=1,
+                    price=float(soa['mid'][short_idx]),
+                    delta=short_greeks.get('delta'),
+                    theta=short_greeks.get('theta'),
+                ),
+            ),
+            explanation=config.description
+        )
     
     def _build_iron_condor(
         self,
         candidate: Dict[str, Any],
         options_data: Dict[str, Any],
         config: StrategyConfig
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[Trade]:
         """Build iron condor trade structure."""
         # Simplified iron condor - sell OTM call and put spreads
         symbol = candidate['symbol']
         underlying_price = options_data['underlying_price']
         
-        calls = options_data.get('calls', [])
-        puts = options_data.get('puts', [])
-        
         # Filter by DTE
-        calls = [c for c in calls if c.get('dte', 999) <= config.max_dte]
-        puts = [c for c in puts if c.get('dte', 999) <= config.max_dte]
+        calls, calls_soa = self._dte_window(options_data, 'calls', config.max_dte)
+        puts, puts_soa = self._dte_window(options_data, 'puts', config.max_dte)
         
         if not calls or not puts:
             return None
         
         # Find OTM call (delta ~0.20)
-        short_call = min(calls, key=lambda x: abs(abs(x.get('greeks', {}).get('delta', 0)) - 0.20))
+        short_call_idx = self._nearest_abs_delta(calls_soa, 0.20)
+        short_call = calls[short_call_idx]
         
         # Find OTM put (delta ~-0.20)
-        short_put = min(puts, key=lambda x: abs(abs(x.get('greeks', {}).get('delta', 0)) - 0.20))
+        short_put_idx = self._nearest_abs_delta(puts_soa, 0.20)
+        short_put = puts[short_put_idx]
         
         # Find protection strikes
-        long_call = min(
-            calls,
-            key=lambda x: abs(x.get('strikePrice', 0) - (short_call.get('strikePrice', 0) + config.spread_width))
-        )
-        
-        long_put = min(
-            puts,
-            key=lambda x: abs(x.get('strikePrice', 0) - (short_put.get('strikePrice', 0) - config.spread_width))
+        long_call_target = short_call.get('strikePrice', 0) + config.spread_width
+        long_call_idx = self._nearest_strike(calls_soa, long_call_target)
+        
+        long_put_target = short_put.get('strikePrice', 0) - config.spread_width
+        long_put_idx = self._nearest_strike(puts_soa, long_put_target)
+        
+        call_mid = calls_soa['mid']
+        put_mid = puts_soa['mid']
+        
+        return Trade(
+            symbol=symbol,
+            strategy=StrategyType.IRON_CONDOR.value,
+            condition=MarketCondition.CHOPPY.value,
+            bias='neutral',
+            underlying_price=underlying_price,
+            expiration=short_call.get('expiration'),
+            dte=short_call.get('dte'),
+            legs=(
+                Leg('SELL', 'CALL', short_call.get('strikePrice'), 1, float(call_mid[short_call_idx])),
+                Leg('BUY', 'CALL', calls[long_call_idx].get('strikePrice'), 1, float(call_mid[long_call_idx])),
+                Leg('SELL', 'PUT', short_put.get('strikePrice'), 1, float(put_mid[short_put_idx])),
+                Leg('BUY', 'PUT', puts[long_put_idx].get('strikePrice'), 1, float(put_mid[long_put_idx])),
+            ),
+            explanation=config.description
         )
-        
-        return {
-            'symbol': symbol,
-            'strategy': StrategyType.IRON_CONDOR.value,
-            'condition': MarketCondition.CHOPPY.value,
-            'bias': 'neutral',
-            'underlying_price': underlying_price,
-            'expiration': short_call.get('expiration'),
-            'dte': short_call.get('dte'),
-            'legs': [
-                {'action': 'SELL', 'option_type': 'CALL', 'strike': short_call.get('strikePrice'),
-                 'quantity': 1, 'price': (short_call.get('bid', 0) + short_call.get('ask', 0)) / 2},
-                {'action': 'BUY', 'option_type': 'CALL', 'strike': long_call.get('strikePrice'),
-                 'quantity': 1, 'price': (long_call.get('bid', 0) + long_call.get('ask', 0)) / 2},
-                {'action': 'SELL', 'option_type': 'PUT', 'strike': short_put.get('strikePrice'),
-                 'quantity': 1, 'price': (short_put.get('bid', 0) + short_put.get('ask', 0)) / 2},
-                {'action': 'BUY', 'option_type': 'PUT', 'strike': long_put.get('strikePrice'),
-                 'quantity': 1, 'price': (long_put.get('bid', 0) + long_put.get('ask', 0)) / 2},
-            ],
-            'explanation': config.description
-        }
@@ -5,6 +5,7 @@ import pandas as pd
 import sys
 import os
 import time
+from sqlalchemy import text
 
 # Add project root to path
 sys.path.append(os.getcwd())
@@ -28,14 +29,27 @@ st.title("🚀 Options Day-Trading Assistant")
 st.sidebar.header("Navigation")
 page = st.sidebar.radio("Go to", ["Dashboard", "Scanner Results", "Trade Journal", "System Health"])
 
+@st.cache_data(ttl=60, show_spinner=False)
 def load_data():
-    """Load trade data from database."""
+    """Load trade data from database, indexed by timestamp (newest first)."""
     engine = get_db_engine()
     try:
         # Load trades with SQL
         query = "SELECT * FROM trades ORDER BY timestamp DESC"
-        df = pd.read_sql(query, engine)
-        return df
+        df = pd.read_sql(query, engine, parse_dates=['timestamp'])
+        return df.set_index('timestamp').sort_index(ascending=False)
+    except Exception as e:
+        st.error(f"Error loading database: {e}")
+        return pd.DataFrame()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_trades_for_symbol(sym):
+    """Load trades for a single symbol using a parameterized query."""
+    engine = get_db_engine()
+    try:
+        query = "SELECT * FROM trades WHERE symbol = :sym ORDER BY timestamp DESC"
+        df = pd.read_sql(text(query), engine, params={'sym': sym}, parse_dates=['timestamp'])
+        return df.set_index('timestamp').sort_index(ascending=False)
     except Exception as e:
         st.error(f"Error loading database: {e}")
         return pd.DataFrame()
@@ -46,13 +60,8 @@ def show_metrics(df):
         st.info("No trades found in database.")
         return
 
-    # Filter for today's trades (assuming 'timestamp' column exists)
-    if 'timestamp' in df.columns:
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        today = pd.Timestamp.now().date()
-        todays_trades = df[df['timestamp'].dt.date == today]
-    else:
-        todays_trades = pd.DataFrame()
+    # Index is sorted newest first, so today's trades are a label slice down to midnight
+    todays_trades = df.loc[:pd.Timestamp.now().normalize()]
 
     col1, col2, col3, col4 = st.columns(4)
     
@@ -77,7 +86,7 @@ if page == "Dashboard":
     with col_left:
         st.markdown("### Recent Activity")
         if not df.empty:
-            st.dataframe(df[['timestamp', 'symbol', 'strategy', 'bias', 'score']].head(10), hide_index=True)
+            st.dataframe(df[['symbol', 'strategy', 'bias', 'score']].head(10).reset_index(), hide_index=True)
             
     with col_right:
         st.markdown("### Risk Distribution")
@@ -93,16 +102,13 @@ elif page == "Scanner Results":
     
 elif page == "Trade Journal":
     st.subheader("📔 Trade Journal")
-    df = load_data()
+    # Filters
+    symbol_filter = st.text_input("Filter by Symbol").strip().upper()
+    df = load_trades_for_symbol(symbol_filter) if symbol_filter else load_data()
     
     if not df.empty:
-        # Filters
-        symbol_filter = st.text_input("Filter by Symbol")
-        if symbol_filter:
-            df = df[df['symbol'].str.contains(symbol_filter.upper())]
-            
         st.dataframe(
-            df, 
+            df.reset_index(), 
             column_config={
                 "timestamp": st.column_config.DatetimeColumn("Time", format="D MMM, HH:mm"),
                 "score": st.column_config.ProgressColumn("Score", min_value=0, max_value=100, format="%f"),
@@ -110,7 +116,7 @@ elif page == "Trade Journal":
             use_container_width=True
         )
     else:
-        st.write("No trades recorded yet.")
+        st.write("No matching trades." if symbol_filter else "No trades recorded yet.")
 
 elif page == "System Health":
     st.subheader("❤️ System Health")
@@ -6,7 +6,10 @@ from .validators import (
     is_valid_greek,
     is_valid_volume,
     validate_option_data,
-    calculate_spread_pct
+    validate_option_arrays,
+    validate_option_batch,
+    calculate_spread_pct,
+    calculate_spread_pct_batch
 )
 
 __all__ = [
@@ -16,5 +19,8 @@ __all__ = [
     'is_valid_greek',
     'is_valid_volume',
     'validate_option_data',
-    'calculate_spread_pct'
+    'validate_option_arrays',
+    'validate_option_batch',
+    'calculate_spread_pct',
+    'calculate_spread_pct_batch'
 ]
@@ -1,25 +1,84 @@
 """Alert system for notifications."""
 
-from datetime import datetime
+import atexit
+import threading
+import time
+from collections import deque
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Seconds between flushes of buffered INFO alerts
+ALERT_FLUSH_INTERVAL = 1.0
+
 class AlertManager:
     """Manage high-priority system alerts."""
     
+    # Buffered INFO alerts, drained by a background timer
+    _buf = deque(maxlen=256)
+    _lock = threading.Lock()
+    _timer = None
+    
+    # (epoch second, formatted string) of the last alert timestamp
+    _last_ts = (0, '')
+    
     @staticmethod
     def send_alert(title: str, message: str, level: str = 'INFO'):
         """
         Send an alert. 
         Currently logs to console/file. Can be extended to Email/SMS.
         
+        INFO alerts are buffered and logged together at most once per
+        ALERT_FLUSH_INTERVAL; WARNING and CRITICAL are sent immediately.
+        
         Args:
             title: Short header
             message: Detailed message
             level: 'INFO', 'WARNING', 'CRITICAL'
         """
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        if level != 'INFO':
+            AlertManager.send_alert_immediate(title, message, level)
+            return
+        
+        # Stamp now, since the buffered line is logged later
+        timestamp = AlertManager._timestamp()
+        full_msg = f"{timestamp} [{level}] {title}: {message}"
+        
+        with AlertManager._lock:
+            AlertManager._buf.append(full_msg)
+            if AlertManager._timer is None:
+                timer = threading.Timer(ALERT_FLUSH_INTERVAL, AlertManager.flush)
+                timer.daemon = True
+                AlertManager._timer = timer
+                timer.start()
+
+    @staticmethod
+    def _timestamp() -> str:
+        """Return the current local time, reformatted at most once per second."""
+        now = int(time.time())
+        last_sec, last_str = AlertManager._last_ts
+        if now == last_sec:
+            return last_str
+        
+        formatted = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))
+        AlertManager._last_ts = (now, formatted)
+        return formatted
+
+    @staticmethod
+    def send_alert_immediate(title: str, message: str, level: str = 'CRITICAL'):
+        """
+        Send an alert without buffering.
+        
+        Buffered INFO alerts are flushed first so the log keeps the order
+        in which alerts were raised.
+        
+        Args:
+            title: Short header
+            message: Detailed message
+            level: 'INFO', 'WARNING', 'CRITICAL'
+        """
+        AlertManager.flush()
+        
         full_msg = f"[{level}] {title}: {message}"
         
         if level == 'CRITICAL':
@@ -31,6 +90,18 @@ class AlertManager:
         else:
             logger.info(full_msg)
 
+    @staticmethod
+    def flush():
+        """Log all buffered INFO alerts as a single record."""
+        with AlertManager._lock:
+            AlertManager._timer = None
+            if not AlertManager._buf:
+                return
+            lines = list(AlertManager._buf)
+            AlertManager._buf.clear()
+        
+        logger.info("\n".join(lines))
+
     @staticmethod
     def notify_trade(trade: dict):
         """Notify user of a new high-quality trade setup."""
@@ -43,3 +114,7 @@ class AlertManager:
             message=f"Strategy: {strategy} | Score: {score}",
             level='INFO'
         )
+
+
+# Don't drop alerts still waiting for the timer
+atexit.register(AlertManager.flush)
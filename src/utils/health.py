@@ -4,25 +4,54 @@ import shutil
 import time
 import os
 from pathlib import Path
-from typing import Dict, Any
+from time import monotonic, perf_counter_ns
+from typing import Dict, Any, Tuple
 from src.data.api_client import get_client
 from src.data.database import get_db_engine
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Seconds a health report is reused so rapid dashboard refreshes don't hit the API
+HEALTH_CACHE_SECONDS = 30
+
+# (monotonic time of last check, report)
+_last_report: Tuple[float, Dict[str, Any]] = (0.0, {})
+
+# Free disk space changes slowly; reuse the reading for a minute
+DISK_CACHE_SECONDS = 60
+
+_ONE_GB = 1 << 30
+
+# path -> (monotonic time of last check, result)
+_disk_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
 class HealthMonitor:
     """Monitor system health metrics."""
     
     @staticmethod
     def check_disk_space(path: str = ".") -> Dict[str, Any]:
-        """Check available disk space."""
-        total, used, free = shutil.disk_usage(path)
-        return {
-            'total_gb': total // (2**30),
-            'free_gb': free // (2**30),
-            'status': 'OK' if free > 1 * (2**30) else 'CRITICAL' # 1GB limit
+        """Check available disk space (reused for DISK_CACHE_SECONDS per path)."""
+        checked_at, result = _disk_cache.get(path, (0.0, None))
+        if result is not None and monotonic() - checked_at < DISK_CACHE_SECONDS:
+            return result
+        
+        if hasattr(os, 'statvfs'):
+            # One statvfs call; free counts only blocks available to unprivileged users
+            st = os.statvfs(path)
+            total = st.f_blocks * st.f_frsize
+            free = st.f_bavail * st.f_frsize
+        else:
+            total, _, free = shutil.disk_usage(path)
+        
+        result = {
+            'total_gb': total >> 30,
+            'free_gb': free >> 30,
+            'used_pct': round((1 - free / total) * 100, 1) if total else 0.0,
+            'status': 'OK' if free > _ONE_GB else 'CRITICAL' # 1GB limit
         }
+        _disk_cache[path] = (monotonic(), result)
+        return result
         
     @staticmethod
     def check_api_latency() -> float:
@@ -31,13 +60,13 @@ class HealthMonitor:
         if not client.client:
             return -1.0
             
-        start = time.time()
+        start = perf_counter_ns()
         # Ensure we don't trigger rate limits or auth errors if token invalid
         # Just checking if client object exists is weak, but actual ping requires auth.
         # Minimal impact: check market hours (fast call)
         try:
             client.is_market_open()
-            return time.time() - start
+            return (perf_counter_ns() - start) / 1e9
         except Exception:
             return -1.0
             
@@ -57,7 +86,12 @@ class HealthMonitor:
             
     @staticmethod
     def run_health_check() -> Dict[str, Any]:
-        """Run full system health check."""
+        """Run full system health check (reused for HEALTH_CACHE_SECONDS)."""
+        global _last_report
+        checked_at, report = _last_report
+        if report and monotonic() - checked_at < HEALTH_CACHE_SECONDS:
+            return report
+        
         disk = HealthMonitor.check_disk_space()
         api_lat = HealthMonitor.check_api_latency()
         db_ok = HealthMonitor.check_database()
@@ -68,10 +102,12 @@ class HealthMonitor:
         elif api_lat > 2.0:
             status = "DEGRADED"
             
-        return {
+        report = {
             'status': status,
             'disk': disk,
             'api_latency': f"{api_lat:.3f}s",
             'database_connected': db_ok,
             'timestamp': str(time.time())
         }
+        _last_report = (monotonic(), report)
+        return report
@@ -1,16 +1,31 @@
 """Logging configuration for the Options Trading Assistant."""
 
+import atexit
 import logging
+import queue
 import sys
+import threading
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
 from rich.logging import RichHandler
 
+# Process-wide log queue drained by a single background writer
+_log_queue: Optional[queue.Queue] = None
+_listener: Optional[QueueListener] = None
+_log_queue_lock = threading.Lock()
+
 
 def setup_logger(name: str = "trading_system", level: int = logging.INFO) -> logging.Logger:
     """
     Set up logger with both console (Rich) and file handlers.
     
+    The handlers are created once and run on a QueueListener thread; each
+    logger only gets a QueueHandler, so logging a record is an enqueue
+    rather than a blocking write and flush.
+    
     Args:
         name: Logger name
         level: Logging level (default: INFO)
@@ -25,6 +40,42 @@ def setup_logger(name: str = "trading_system", level: int = logging.INFO) -> log
     if logger.handlers:
         return logger
     
+    logger.addHandler(QueueHandler(_get_log_queue(level)))
+    
+    return logger
+
+
+def _get_log_queue(level: int) -> queue.Queue:
+    """
+    Create the shared log queue and start its listener on first use.
+    
+    Args:
+        level: Console logging level
+        
+    Returns:
+        Queue that all configured loggers enqueue records to
+    """
+    if _log_queue is not None:
+        return _log_queue
+    
+    # Concurrent first calls must not start two listeners or open the files twice
+    with _log_queue_lock:
+        if _log_queue is None:
+            _start_log_listener(level)
+    return _log_queue
+
+
+def _start_log_listener(level: int):
+    """
+    Build the console and file handlers and start the queue listener.
+    
+    Must be called with _log_queue_lock held.
+    
+    Args:
+        level: Console logging level
+    """
+    global _log_queue, _listener
+    
     # Create logs directory if it doesn't exist
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
@@ -64,14 +115,23 @@ def setup_logger(name: str = "trading_system", level: int = logging.INFO) -> log
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(file_format)
     
-    # Add handlers
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
-    logger.addHandler(error_handler)
+    log_queue = queue.Queue(-1)
+    _listener = QueueListener(
+        log_queue,
+        console_handler,
+        file_handler,
+        error_handler,
+        respect_handler_level=True
+    )
+    _listener.start()
+    # Drain queued records before the interpreter exits
+    atexit.register(_listener.stop)
     
-    return logger
+    # Publish last so the unlocked fast path never sees a half-built setup
+    _log_queue = log_queue
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str = "trading_system") -> logging.Logger:
-    """Get or create logger instance."""
+    """Get or create logger instance (memoized; loggers are never replaced)."""
     return logging.getLogger(name)
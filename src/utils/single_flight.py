@@ -0,0 +1,81 @@
+"""Single-flight guard to collapse concurrent cache misses into one fetch."""
+
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class SingleFlight:
+    """Allow at most one in-flight fetch per key."""
+
+    def __init__(self, wait_timeout: float = 30.0):
+        """
+        Initialize single-flight guard.
+
+        Args:
+            wait_timeout: Max seconds a waiting caller blocks on the leader
+        """
+        self.wait_timeout = wait_timeout
+        self._inflight: Dict[str, threading.Event] = {}
+        self._inflight_lock = threading.Lock()
+
+    def in_flight(self, key: str) -> bool:
+        """
+        Check whether a fetch for key is currently running.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            True if a leader is fetching key
+        """
+        with self._inflight_lock:
+            return key in self._inflight
+    
+    def do(
+        self,
+        key: str,
+        read_cache: Callable[[], Optional[Any]],
+        fetch: Callable[[], Optional[Any]]
+    ) -> Optional[Any]:
+        """
+        Run fetch for key unless another caller is already fetching it.
+
+        The first caller (leader) performs the fetch. Callers arriving while
+        the leader is in flight wait for it to finish, then re-read the cache
+        the leader populated instead of issuing a duplicate request. A new
+        leader also re-reads the cache before fetching, since a previous
+        leader may have stored the value after this caller's own cache check.
+
+        Args:
+            key: Cache key (e.g. 'quote:AAPL')
+            read_cache: Callable returning the cached value or None
+            fetch: Callable that fetches and caches the value
+
+        Returns:
+            Fetched or cached value, or None
+        """
+        with self._inflight_lock:
+            event = self._inflight.get(key)
+            is_leader = event is None
+            if is_leader:
+                event = threading.Event()
+                self._inflight[key] = event
+
+        if not is_leader:
+            if not event.wait(self.wait_timeout):
+                logger.warning(f"Timed out waiting for in-flight fetch of {key}")
+            return read_cache()
+
+        try:
+            cached = read_cache()
+            if cached is not None:
+                return cached
+            return fetch()
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+            event.set()
@@ -1,8 +1,10 @@
 """Data validation utilities."""
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import math
 
+import numpy as np
+
 
 def is_valid_price(price: Optional[float]) -> bool:
     """Check if price is valid (not None, NaN, or negative)."""
@@ -62,6 +64,76 @@ def validate_option_data(option: Dict[str, Any]) -> bool:
     return True
 
 
+def validate_option_arrays(
+    bid: np.ndarray,
+    ask: np.ndarray,
+    open_interest: np.ndarray,
+    volume: np.ndarray,
+    delta: np.ndarray,
+    gamma: np.ndarray,
+    theta: np.ndarray,
+    vega: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized form of validate_option_data over option columns.
+    
+    Missing values should be NaN; they fail every check.
+    
+    Args:
+        bid: Bid prices
+        ask: Ask prices
+        open_interest: Open interest
+        volume: Total volume
+        delta: Delta values
+        gamma: Gamma values
+        theta: Theta values
+        vega: Vega values
+        
+    Returns:
+        Boolean array, True where the option is valid
+    """
+    # NaN compares False, so the >= checks also reject missing volume/OI
+    return (
+        np.isfinite(bid) & (bid > 0) &
+        np.isfinite(ask) & (ask > 0) &
+        (open_interest >= 0) & (volume >= 0) &
+        np.isfinite(delta) & np.isfinite(gamma) &
+        np.isfinite(theta) & np.isfinite(vega)
+    )
+
+
+def validate_option_batch(options: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    Validate many options at once.
+    
+    Same rules as validate_option_data: required fields must be present
+    and valid, and any Greek that is present must be finite.
+    
+    Args:
+        options: Option data dictionaries
+        
+    Returns:
+        Boolean array, True where the option is valid
+    """
+    rows = []
+    for option in options:
+        # Absent Greeks are allowed, so they default to 0; None becomes NaN
+        greeks = option.get('greeks') or {}
+        rows.append((
+            option.get('bid'),
+            option.get('ask'),
+            option.get('openInterest'),
+            option.get('totalVolume'),
+            greeks.get('delta', 0),
+            greeks.get('gamma', 0),
+            greeks.get('theta', 0),
+            greeks.get('vega', 0)
+        ))
+    table = np.array(rows, dtype=np.float64).reshape(len(rows), 8)
+    
+    return validate_option_arrays(*table.T)
+
+
 def calculate_spread_pct(bid: float, ask: float) -> float:
     """
     Calculate bid-ask spread as percentage of mid price.
@@ -76,8 +148,21 @@ def calculate_spread_pct(bid: float, ask: float) -> float:
     if bid <= 0 or ask <= 0 or ask < bid:
         return float('inf')
     
-    mid = (bid + ask) / 2
-    if mid == 0:
-        return float('inf')
+    # (ask - bid) / mid * 100 with mid = (ask + bid) / 2, using one division
+    return (ask - bid) * 200.0 / (ask + bid)
+
+
+def calculate_spread_pct_batch(bids: np.ndarray, asks: np.ndarray) -> np.ndarray:
+    """
+    Vectorized form of calculate_spread_pct.
     
-    return ((ask - bid) / mid) * 100
+    Args:
+        bids: Bid prices
+        asks: Ask prices
+        
+    Returns:
+        Spread percentages, inf where the quote is missing, non-positive or crossed
+    """
+    valid = (bids > 0) & (asks >= bids)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(valid, (asks - bids) * 200.0 / (asks + bids), np.inf)
@@ -1,11 +1,9 @@
 """Verification script for Phase 2 Analytics."""
 
-import sys
-import os
 from datetime import datetime
+import numpy as np
 
-# Add project root to path
-sys.path.append(os.getcwd())
+from verify_common import check  # also adds project root to sys.path
 
 from src.analytics.greeks import GreeksCalculator
 from src.analytics.portfolio import PortfolioManager
@@ -25,9 +23,28 @@ def test_greeks_calculation():
     
     print(f"Calculated Greeks: {greeks}")
     
-    assert 0.60 < greeks['delta'] < 0.66, "Delta calculation looks off"
-    assert greeks['theta'] < 0, "Theta should be negative for long call"
+    check(0.60 < greeks['delta'] < 0.66, "Delta calculation looks off")
+    check(greeks['theta'] < 0, "Theta should be negative for long call")
     print("[OK] Greeks calculation verified against expected range")
+    
+    # Grid: S x sigma in one vectorized call
+    S = np.linspace(90, 110, 11)
+    sigma = np.array([0.10, 0.20, 0.30])
+    grid = GreeksCalculator.calculate_greeks_batch(
+        S=S[:, None], K=100.0, T=1.0, r=0.05, sigma=sigma[None, :], option_type='c'
+    )
+    
+    check(grid['delta'].shape == (len(S), len(sigma)), "Batch Greeks should broadcast to the grid")
+    check(np.all((grid['delta'] > 0) & (grid['delta'] < 1)), "Call delta out of (0, 1)")
+    check(np.all(np.diff(grid['delta'], axis=0) > 0), "Call delta should rise with spot")
+    check(np.all(grid['gamma'] > 0), "Gamma should be positive")
+    check(np.all(grid['vega'] > 0), "Vega should be positive")
+    check(np.all(grid['theta'] < 0), "Theta should be negative for long calls")
+    
+    # Grid point S=100, sigma=20% must agree with the scalar calculation
+    for name, value in greeks.items():
+        check(np.isclose(grid[name][5, 1], value), f"Batch {name} disagrees with scalar")
+    print(f"[OK] Greeks grid verified ({grid['delta'].size} points)")
 
 def test_portfolio_manager():
     print("\n[Test] Testing Portfolio Manager...")
@@ -50,8 +67,8 @@ def test_portfolio_manager():
     
     print("Portfolio Summary:", summary)
     
-    assert summary['open_positions'] > 0, "Should have at least 1 open position"
-    assert summary['total_max_loss'] >= 500, "Max loss aggregation failed"
+    check(summary['open_positions'] > 0, "Should have at least 1 open position")
+    check(summary['total_max_loss'] >= 500, "Max loss aggregation failed")
     print("[OK] Portfolio aggregation verified")
 
 def test_alerts():
@@ -0,0 +1,24 @@
+"""Shared setup and checks for the verify_* scripts."""
+
+import os
+import sys
+
+# Project root, resolved from this file so scripts work from any directory
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+
+def check(condition: bool, message: str = "Check failed"):
+    """
+    Fail verification when condition is false.
+    
+    Unlike assert, this still runs under python -O.
+    
+    Args:
+        condition: Result of the check
+        message: Error message on failure
+    """
+    if not condition:
+        raise AssertionError(message)
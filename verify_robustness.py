@@ -1,25 +1,16 @@
 """Verification script for robustness features."""
 
-import sys
-import os
-import time
-from pathlib import Path
 from datetime import datetime
 
-# Add project root to path
-sys.path.append(os.getcwd())
+import verify_common  # noqa: F401  (adds project root to sys.path)
 
-from src.data.api_client import TDAClient, RateLimitError, APIError, CircuitBreakerOpen
-from src.data.models import OptionContract, Trade
-from src.data.database import init_db, get_session
-from src.data.repository import TradeRepository
-from src.analytics.risk_metrics import RiskMetrics
-from src.utils.logger import setup_logger
-
-logger = setup_logger()
+# Project modules (pydantic, sqlalchemy, pandas chains) are imported inside
+# the tests that use them so that importing this file stays cheap.
 
 def test_data_models():
     """Test Pydantic data models."""
+    from src.data.models import OptionContract
+    
     print("\n🧪 Testing Data Models...")
     try:
         # Valid contract
@@ -60,10 +51,23 @@ def test_data_models():
 
 def test_database():
     """Test database persistence."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+    from src.data.database import Base
+    from src.data.repository import TradeRepository
+    
     print("\n🧪 Testing Database Persistence...")
     try:
-        init_db()
-        repo = TradeRepository()
+        # Private in-memory database: no disk commits, no TEST_SYM rows left in the real DB.
+        # StaticPool keeps the single connection so the tables outlive create_all.
+        engine = create_engine(
+            "sqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool
+        )
+        Base.metadata.create_all(engine)
+        repo = TradeRepository(session=sessionmaker(bind=engine)())
         
         trade_data = {
             'symbol': 'TEST_SYM',
@@ -94,6 +98,8 @@ def test_database():
         print(f"❌ Database test FAILED: {e}")
 
 def test_risk_metrics():
+    from src.analytics.risk_metrics import RiskMetrics
+    
     print("\n🧪 Testing Risk Metrics...")
     size = RiskMetrics.calculate_position_size(
         account_size=10000,
@@ -115,6 +121,9 @@ def test_risk_metrics():
     print(f"✓ Blocked position size (should be 0): {blocked_size}")
 
 if __name__ == "__main__":
+    from src.utils.logger import setup_logger
+    
+    logger = setup_logger()
     print("🚀 Starting Robustness Verification")
     test_data_models()
     test_database()
@@ -3,76 +3,170 @@ Quick setup verification script.
 Run this to verify your installation is correct.
 """
 
+import importlib
+import importlib.util
+import io
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, Optional
+
+
+def _try_import(module: str) -> Optional[Exception]:
+    """Import a module, returning the exception instead of raising it."""
+    try:
+        importlib.import_module(module)
+        return None
+    except Exception as e:
+        return e
+
+
+def _read_env_file(path: str = '.env') -> Dict[str, str]:
+    """
+    Read KEY=VALUE pairs from a .env file.
+    
+    Handles comments, 'export ' prefixes and single- or double-quoted
+    values without importing python-dotenv; lines this can't parse fall
+    back to dotenv's parser.
+    
+    Args:
+        path: Path to the .env file
+        
+    Returns:
+        Dictionary of variable name to value
+    """
+    try:
+        env = {}
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                key, sep, value = line.removeprefix('export ').partition('=')
+                if not sep:
+                    raise ValueError(f"Unparsable .env line: {line}")
+                value = value.strip()
+                if value[:1] in ('"', "'"):
+                    if len(value) < 2 or value[-1] != value[0]:
+                        raise ValueError(f"Unterminated quote in .env: {key}")
+                    value = value[1:-1]
+                else:
+                    # Unquoted values may carry an inline comment
+                    value = value.split(' #', 1)[0].rstrip()
+                env[key.strip()] = value
+        return env
+    except ValueError:
+        from dotenv import dotenv_values
+        return {k: v for k, v in dotenv_values(path).items() if v is not None}
+
 
 def verify_installation():
-    """Verify that all components are installed correctly."""
+    """
+    Verify that all components are installed correctly.
     
-    print("🔍 Verifying Options Trading System Installation...\n")
+    The report is buffered and written once instead of print-by-print.
+    """
+    out = io.StringIO()
+    try:
+        return _verify_installation(out)
+    finally:
+        _flush(out)
+
+
+def _flush(out: io.StringIO):
+    """Write buffered report text to stdout and empty the buffer."""
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
+    out.seek(0)
+    out.truncate()
+
+
+def _verify_installation(out: io.StringIO) -> int:
+    """
+    Run the installation checks, writing the report to out.
+    
+    Args:
+        out: Buffer for the stdout report
+        
+    Returns:
+        Process exit code
+    """
+    
+    print("🔍 Verifying Options Trading System Installation...\n", file=out)
     
     errors = []
     warnings = []
     
     # Check Python version
-    print("1. Checking Python version...")
+    print("1. Checking Python version...", file=out)
     if sys.version_info < (3, 11):
         errors.append(f"Python 3.11+ required, found {sys.version_info.major}.{sys.version_info.minor}")
     else:
-        print(f"   ✓ Python {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}")
+        print(f"   ✓ Python {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}", file=out)
     
     # Check dependencies
-    print("\n2. Checking dependencies...")
-    required_packages = [
+    print("\n2. Checking dependencies...", file=out)
+    required_packages = frozenset({
         'pandas', 'numpy', 'scipy', 'tda', 'sqlalchemy',
         'pydantic', 'pydantic_settings', 'rich', 'dotenv'
-    ]
+    })
     
-    for package in required_packages:
-        try:
-            __import__(package)
-            print(f"   ✓ {package}")
-        except ImportError:
+    # find_spec locates each top-level package without importing it
+    for package in sorted(required_packages):
+        if importlib.util.find_spec(package) is not None:
+            print(f"   ✓ {package}", file=out)
+        else:
             errors.append(f"Missing package: {package}")
-            print(f"   ✗ {package} - NOT FOUND")
+            print(f"   ✗ {package} - NOT FOUND", file=out)
     
     # Check directory structure
-    print("\n3. Checking directory structure...")
+    print("\n3. Checking directory structure...", file=out)
     required_dirs = [
         'config', 'src/scanner', 'src/strategies', 'src/analytics',
         'src/scoring', 'src/integration', 'src/data', 'src/utils',
         'outputs/trades', 'outputs/alerts', 'outputs/watchlists', 'logs'
     ]
     
+    # One shallow walk collects every directory we could need, instead of a stat per path
+    required_depth = max(os.path.normpath(d).count(os.sep) for d in required_dirs) + 1
+    skip_dirs = {'.git', '__pycache__', 'node_modules'}
+    present = set()
+    for root, dirs, _ in os.walk('.', topdown=True):
+        rel_root = os.path.relpath(root, '.')
+        depth = 0 if rel_root == '.' else rel_root.count(os.sep) + 1
+        present.update(os.path.normpath(os.path.join(rel_root, d)) for d in dirs)
+        # Don't descend below the deepest required path
+        dirs[:] = [] if depth + 1 >= required_depth else [d for d in dirs if d not in skip_dirs]
+    
     for dir_path in required_dirs:
-        if Path(dir_path).exists():
-            print(f"   ✓ {dir_path}")
+        if os.path.normpath(dir_path) in present:
+            print(f"   ✓ {dir_path}", file=out)
         else:
             errors.append(f"Missing directory: {dir_path}")
-            print(f"   ✗ {dir_path} - NOT FOUND")
+            print(f"   ✗ {dir_path} - NOT FOUND", file=out)
     
     # Check configuration
-    print("\n4. Checking configuration...")
+    print("\n4. Checking configuration...", file=out)
     if Path('.env').exists():
-        print("   ✓ .env file exists")
+        print("   ✓ .env file exists", file=out)
         
-        # Check if API key is set
-        from dotenv import load_dotenv
-        import os
-        load_dotenv()
+        # Check if API key is set; like load_dotenv, real environment variables win
+        for key, value in _read_env_file('.env').items():
+            os.environ.setdefault(key, value)
         
         api_key = os.getenv('TDA_API_KEY')
         if api_key and api_key != 'your_api_key_here':
-            print("   ✓ TDA_API_KEY is configured")
+            print("   ✓ TDA_API_KEY is configured", file=out)
         else:
             warnings.append("TDA_API_KEY not configured in .env")
-            print("   ⚠ TDA_API_KEY needs to be set")
+            print("   ⚠ TDA_API_KEY needs to be set", file=out)
     else:
         warnings.append(".env file not found - copy from .env.example")
-        print("   ⚠ .env file not found")
+        print("   ⚠ .env file not found", file=out)
     
     # Check main modules
-    print("\n5. Checking main modules...")
+    print("\n5. Checking main modules...", file=out)
     modules_to_check = [
         'config.settings',
         'src.scanner.market_scanner',
@@ -88,40 +182,49 @@ def verify_installation():
         'src.data.cache'
     ]
     
-    for module in modules_to_check:
-        try:
-            __import__(module)
-            print(f"   ✓ {module}")
-        except Exception as e:
-            errors.append(f"Module {module} failed to import: {str(e)}")
-            print(f"   ✗ {module} - ERROR")
+    # Overlap .pyc reads across threads; report in the listed order
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(_try_import, modules_to_check))
+    
+    for module, error in zip(modules_to_check, results):
+        if error is None:
+            print(f"   ✓ {module}", file=out)
+        else:
+            errors.append(f"Module {module} failed to import: {str(error)}")
+            print(f"   ✗ {module} - ERROR", file=out)
     
     # Summary
-    print("\n" + "="*60)
+    print("\n" + "="*60, file=out)
+    # Errors and warnings go to stderr in a single write, for CI log parsers
+    _flush(out)
+    report = io.StringIO()
     if errors:
-        print(f"\n❌ ERRORS FOUND ({len(errors)}):")
+        print(f"\n❌ ERRORS FOUND ({len(errors)}):", file=report)
         for error in errors:
-            print(f"   • {error}")
+            print(f"   • {error}", file=report)
     
     if warnings:
-        print(f"\n⚠️  WARNINGS ({len(warnings)}):")
+        print(f"\n⚠️  WARNINGS ({len(warnings)}):", file=report)
         for warning in warnings:
-            print(f"   • {warning}")
+            print(f"   • {warning}", file=report)
+    
+    sys.stderr.write(report.getvalue())
+    sys.stderr.flush()
     
     if not errors and not warnings:
-        print("\n✅ ALL CHECKS PASSED!")
-        print("\nYou're ready to run the trading system:")
-        print("   python main.py")
+        print("\n✅ ALL CHECKS PASSED!", file=out)
+        print("\nYou're ready to run the trading system:", file=out)
+        print("   python main.py", file=out)
     elif not errors:
-        print("\n✅ INSTALLATION COMPLETE (with warnings)")
-        print("\nAddress warnings above, then run:")
-        print("   python main.py")
+        print("\n✅ INSTALLATION COMPLETE (with warnings)", file=out)
+        print("\nAddress warnings above, then run:", file=out)
+        print("   python main.py", file=out)
     else:
-        print("\n❌ INSTALLATION INCOMPLETE")
-        print("\nFix errors above, then run this script again.")
+        print("\n❌ INSTALLATION INCOMPLETE", file=out)
+        print("\nFix errors above, then run this script again.", file=out)
         return 1
     
-    print("="*60)
+    print("="*60, file=out)
     return 0
 
 